@@ -0,0 +1,90 @@
+"""
+Synthetic note databases for the benchmarks.
+
+Sizes follow what real ScratchPad databases look like: mostly short notes,
+a long tail of pasted transcripts and logs (CoPilot, Notes), short contacts
+and bookmarks, and a handful of sticky notes. Generation is seeded, so a
+given (count, seed) always produces the same database.
+"""
+import math
+import os
+import random
+import shutil
+
+# category: (share of notes, median body chars, lognormal sigma)
+CATEGORY_PROFILES = {
+    "Notes": (0.45, 600, 1.3),
+    "CoPilot": (0.25, 2500, 1.5),
+    "Contacts": (0.14, 160, 0.5),
+    "Bookmarks": (0.15, 120, 0.5),
+    "sticky": (0.01, 200, 0.8),
+}
+MAX_BODY_CHARS = 400_000
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+_WORDS = (
+    "the meeting notes action item follow up deploy server error log request "
+    "response latency query index cache page user session token config build "
+    "release branch merge review test failure retry timeout network disk memory "
+    "thread worker queue event signal widget window editor preview search"
+).split()
+
+
+def _body(rng, chars):
+    words = []
+    size = 0
+    while size < chars:
+        line = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 14)))
+        words.append(line)
+        size += len(line) + 1
+    return "\n".join(words)[:chars]
+
+
+def generate_notes(count, seed=0):
+    """Yield count note records ({'category', 'title', 'content'})."""
+    rng = random.Random(seed)
+    categories = list(CATEGORY_PROFILES)
+    weights = [CATEGORY_PROFILES[c][0] for c in categories]
+    for i in range(count):
+        category = rng.choices(categories, weights)[0]
+        _, median, sigma = CATEGORY_PROFILES[category]
+        chars = min(MAX_BODY_CHARS, max(1, int(rng.lognormvariate(math.log(median), sigma))))
+        content = _body(rng, chars)
+        title = f"{content.split(chr(10), 1)[0][:24]} {i}"
+        yield {'category': category, 'title': title, 'content': content}
+
+
+def build_database(path, count, seed=0):
+    """Create a database at path holding `count` generated notes."""
+    from models.model import NoteModel
+
+    model = NoteModel(path, profile="bulk")
+    try:
+        model.import_notes(generate_notes(count, seed))
+        model.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        model.close()
+
+
+def database_copy(count, workdir, seed=0, cache_dir=CACHE_DIR):
+    """
+    Copy of a generated database in workdir, so a benchmark can write to it.
+    Generated databases are cached in cache_dir across runs.
+    """
+    from models.model import NoteModel
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Keyed by schema version too, so a cached copy never needs migrating
+    cached = os.path.join(cache_dir, f"notes_{count}_{seed}_v{len(NoteModel.MIGRATIONS)}.db")
+    if not os.path.exists(cached):
+        tmp = cached + ".building"
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(tmp + suffix):
+                os.remove(tmp + suffix)
+        build_database(tmp, count, seed)
+        os.replace(tmp, cached)
+
+    path = os.path.join(workdir, f"notes_{count}.db")
+    shutil.copyfile(cached, path)
+    return path
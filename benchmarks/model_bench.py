@@ -0,0 +1,226 @@
+"""
+NoteModel benchmarks at realistic database sizes. Headless: no Qt needed.
+
+    python -m benchmarks.model_bench                       # 1k, 10k, 100k notes
+    python -m benchmarks.model_bench --sizes 1000 --out before.json
+    python -m benchmarks.model_bench --out after.json --compare before.json
+
+Each size runs against a fresh copy of a cached synthetic database
+(benchmarks/dataset.py). Results are written as JSON: one entry per
+(size, operation) with per-call timings in milliseconds. The write-behind
+run also checks that SQL tracing times a background flush's statements no
+longer than the flush itself; a failed check exits with status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.dataset import database_copy
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def summarize(samples):
+    """Timing summary (ms) of a list of per-call durations in seconds."""
+    ms = sorted(s * 1000 for s in samples)
+
+    def pct(p):
+        return ms[min(len(ms) - 1, int(round(p / 100 * (len(ms) - 1))))]
+
+    return {
+        'n': len(ms),
+        'min_ms': round(ms[0], 4),
+        'p50_ms': round(statistics.median(ms), 4),
+        'p95_ms': round(pct(95), 4),
+        'p99_ms': round(pct(99), 4),
+        'max_ms': round(ms[-1], 4),
+        'mean_ms': round(statistics.fmean(ms), 4),
+    }
+
+
+def timed(func, args_list):
+    samples = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_model(model, rng, repeat):
+    """Time the model operations; returns {operation: [seconds, ...]}."""
+    ids = {}
+    for category in ("Notes", "CoPilot", "Contacts", "Bookmarks", "sticky"):
+        ids[category] = [n['id'] for n in model.get_note_summaries(category)]
+    pairs = [(c, note_id) for c, id_list in ids.items() for note_id in id_list]
+    picks = [rng.choice(pairs) for _ in range(repeat)]
+    results = {}
+
+    results['get_notes'] = timed(model.get_notes, [("Notes",)] * max(3, repeat // 50))
+    results['get_note_summaries'] = timed(model.get_note_summaries, [("Notes",)] * max(3, repeat // 10))
+    # First page of each list order, as the note list loads it
+    for order in ("title", "updated"):
+        results[f'list_notes ({order})'] = timed(model.list_notes, [("Notes", order)] * repeat)
+
+    model.content_cache.clear()
+    results['get_note_by_id (cold)'] = timed(model.get_note_by_id, picks)
+    results['get_note_by_id (warm)'] = timed(model.get_note_by_id, picks)
+
+    results['get_category_stats'] = timed(model.get_category_stats, [()] * repeat)
+    results['search'] = timed(model.search, [(rng.choice(("deploy", "error lo", "cache page")),)
+                                             for _ in range(repeat)])
+
+    bodies = [model.get_note_by_id(c, i)['content'] for c, i in picks]
+    new_ids = []
+    results['add_note'] = timed(
+        lambda body: new_ids.append(model.add_note("Notes", "bench", body)),
+        [(body,) for body in bodies]
+    )
+    results['edit_note'] = timed(
+        model.edit_note,
+        [("Notes", note_id, "bench edited", body + "\nedited") for note_id, body in zip(new_ids, bodies)]
+    )
+    results['delete_note'] = timed(model.delete_note, [("Notes", note_id) for note_id in new_ids])
+
+    # Sticky autosave: the same few notes saved over and over while typing
+    sticky = ids["sticky"][:5] or [model.add_sticky_note() for _ in range(5)]
+    saves = [(rng.choice(sticky), f"sticky text {i} " * rng.randint(1, 40)) for i in range(repeat)]
+    results['save_note_content (sticky)'] = timed(model.save_note_content, saves)
+    return results
+
+
+def check_flush_tracing(model, flushes=5):
+    """
+    With SQL tracing on, a background write-behind flush must not time any
+    statement for longer than the flush itself took. Returns (longest
+    statement, longest flush) in seconds.
+    """
+    from utils.instrumentation import Instrumentation
+
+    tracer = Instrumentation(enabled=True, slow_query_ms=float("inf"))
+    queue = model.write_queue
+    apply_batch = queue.apply_batch
+    durations = []
+
+    def timed_batch(batch):
+        start = time.perf_counter()
+        try:
+            return apply_batch(batch)
+        finally:
+            durations.append(time.perf_counter() - start)
+
+    note_id = model.add_note("Notes", "trace check", "")
+    model.flush_writes()
+    queue.apply_batch = timed_batch
+    model.db.set_trace_callback(tracer.trace, tracer.end_statement)
+    try:
+        for i in range(flushes):
+            model.save_note_content(note_id, f"trace check {i}")
+            # Idle past the flush interval so the background thread does the write
+            deadline = time.monotonic() + queue.interval * 20
+            while len(durations) <= i and time.monotonic() < deadline:
+                time.sleep(queue.interval)
+            time.sleep(queue.interval)
+    finally:
+        model.db.set_trace_callback(None)
+        queue.apply_batch = apply_batch
+    model.delete_note("Notes", note_id)
+    longest = max((q['max_ms'] for q in tracer.snapshot()['queries'].values()), default=0.0) / 1000
+    return longest, max(durations, default=0.0)
+
+
+def run(sizes, repeat, seed):
+    from models.model import NoteModel
+
+    entries = []
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="scratchpad-bench-") as workdir:
+        for size in sizes:
+            for write_behind in (None, 0.05):
+                path = database_copy(size, workdir, seed)
+                model = NoteModel(path, write_behind_interval=write_behind)
+                try:
+                    rng = random.Random(seed)
+                    results = bench_model(model, rng, repeat)
+                    if write_behind is not None:
+                        # Queued writes must still reach the disk; charge the flush too
+                        results['flush_writes'] = timed(model.flush_writes, [()])
+                        statement, flush = check_flush_tracing(model)
+                        if statement > flush:
+                            failures.append(f"{size}: traced statement of {statement * 1000:.1f} ms "
+                                            f"in a {flush * 1000:.1f} ms background flush")
+                finally:
+                    model.close()
+                mode = "write-behind" if write_behind is not None else "direct"
+                for op, samples in results.items():
+                    entries.append({'size': size, 'mode': mode, 'op': op, **summarize(samples)})
+                    print(f"{size:>7} {mode:<12} {op:<28} p50 {entries[-1]['p50_ms']:>9.3f} ms"
+                          f"  p95 {entries[-1]['p95_ms']:>9.3f} ms", file=sys.stderr)
+                os.remove(path)
+    return entries, failures
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(entries, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(e['size'], e['mode'], e['op']): e for e in json.load(f)['results']}
+    print(f"{'size':>7} {'mode':<12} {'operation':<28} {'before':>10} {'after':>10} {'ratio':>7}")
+    for e in entries:
+        old = baseline.get((e['size'], e['mode'], e['op']))
+        if old is None or not old['p50_ms']:
+            continue
+        ratio = e['p50_ms'] / old['p50_ms']
+        print(f"{e['size']:>7} {e['mode']:<12} {e['op']:<28} {old['p50_ms']:>10.3f} {e['p50_ms']:>10.3f} {ratio:>6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.model_bench", description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=200, help="calls per operation (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="model_bench.json", help="results file (default: %(default)s)")
+    parser.add_argument("--compare", metavar="BASELINE", help="print p50 ratios against an earlier results file")
+    args = parser.parse_args(argv)
+
+    entries, failures = run(args.sizes, args.repeat, args.seed)
+    report = {
+        'meta': {
+            'benchmark': "model",
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': entries,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {args.out}", file=sys.stderr)
+
+    if args.compare:
+        compare(entries, args.compare)
+    for failure in failures:
+        print(f"check failed: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
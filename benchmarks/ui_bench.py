@@ -0,0 +1,239 @@
+"""
+UI latency benchmarks: drives MainWindow under the offscreen Qt platform.
+
+    python -m benchmarks.ui_bench                      # 1k and 10k notes
+    python -m benchmarks.ui_bench --sizes 100000 --steps 100 --out ui.json
+
+Each interaction is sent as a real input event (mouse click, key press) and
+timed until its processing has finished: the event has been handled, every
+model call it started has delivered its result, and the preview has finished
+streaming. Results use the same JSON layout as model_bench, with p50/p95/p99.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+# Must be set before Qt is imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QEventLoop, QObject, Qt, QTimer  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from benchmarks.dataset import database_copy  # noqa: E402
+from benchmarks.model_bench import compare, summarize, _git_commit  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 10_000)
+SETTLE_TIMEOUT_S = 30
+CATEGORIES = ("Notes", "CoPilot", "Contacts", "Bookmarks")
+
+
+class UiDriver:
+    """Sends input to a MainWindow and waits for the work it causes to finish."""
+
+    def __init__(self, window):
+        self.app = QApplication.instance()
+        self.window = window
+        self.view = window.view
+        # Wakes the event loop while waiting, in case nothing else does
+        self._tick = QTimer()
+        self._tick.setInterval(20)
+        self._tick.start()
+
+    def busy(self):
+        return (self.view.navigation.is_pending() or not self.window.async_model.is_idle()
+                or self.view.preview_renderer.is_streaming())
+
+    def settle(self):
+        """Process events until the UI has nothing left to do for the last input."""
+        deadline = time.perf_counter() + SETTLE_TIMEOUT_S
+        while True:
+            self.app.processEvents(QEventLoop.AllEvents)
+            if not self.busy():
+                # One more pass for whatever the last callbacks posted (layout, repaint)
+                self.app.processEvents(QEventLoop.AllEvents)
+                if not self.busy():
+                    return
+                continue
+            if time.perf_counter() > deadline:
+                raise TimeoutError("UI did not settle")
+            self.app.processEvents(QEventLoop.WaitForMoreEvents)
+
+    def timed(self, action):
+        start = time.perf_counter()
+        action()
+        self.settle()
+        return time.perf_counter() - start
+
+    def category_button(self, category):
+        return next(btn for btn in self.view.sidebar.category_buttons if btn.text() == category)
+
+    def click(self, widget):
+        QTest.mouseClick(widget, Qt.LeftButton)
+
+
+class _ShowWatcher(QObject):
+    """Calls on_show(widget) when a widget of the given class is shown."""
+
+    def __init__(self, cls, on_show):
+        super().__init__()
+        self.cls = cls
+        self.on_show = on_show
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Show and isinstance(obj, self.cls):
+            self.on_show(obj)
+        return False
+
+
+def bench_category_switch(driver, steps, rng):
+    samples = []
+    for _ in range(steps):
+        button = driver.category_button(rng.choice(CATEGORIES))
+        samples.append(driver.timed(lambda: driver.click(button)))
+    return samples
+
+
+def bench_arrow_selection(driver, steps):
+    driver.click(driver.category_button("Notes"))
+    driver.settle()
+    note_list = driver.view.note_list
+    note_list.setFocus()
+    note_list.setCurrentIndex(driver.view.note_list_model.index(0))
+    driver.settle()
+    samples = []
+    for _ in range(steps):
+        samples.append(driver.timed(lambda: QTest.keyClick(note_list.viewport(), Qt.Key_Down)))
+    return samples
+
+
+def bench_editor(driver, steps):
+    """Double-click a note to open the editor, type, and press Save."""
+    from views.components.editor_panel import EditorPanel
+
+    driver.click(driver.category_button("Notes"))
+    driver.settle()
+    open_samples, save_samples = [], []
+    state = {}
+
+    def on_show(editor):
+        state['shown'] = time.perf_counter()
+        # Runs inside the editor's modal loop
+        QTimer.singleShot(0, lambda: save(editor))
+
+    def save(editor):
+        editor.text_edit.moveCursor(editor.text_edit.textCursor().MoveOperation.End)
+        QTest.keyClicks(editor.text_edit, " edited")
+        state['save'] = time.perf_counter()
+        driver.click(editor.save_btn)
+
+    watcher = _ShowWatcher(EditorPanel, on_show)
+    driver.app.installEventFilter(watcher)
+    try:
+        model = driver.view.note_list_model
+        for step in range(steps):
+            index = model.index(step % max(1, min(model.rowCount(), 50)))
+            rect = driver.view.note_list.visualRect(index)
+            state.clear()
+            viewport = driver.view.note_list.viewport()
+            start = time.perf_counter()
+            # A real double click: the view only reports it after a first press
+            QTest.mouseClick(viewport, Qt.LeftButton, pos=rect.center())
+            QTest.mouseDClick(viewport, Qt.LeftButton, pos=rect.center())
+            if 'shown' not in state:
+                # The double click only queued the load; wait for the editor to appear
+                driver.settle()
+            driver.settle()
+            if 'shown' in state:
+                open_samples.append(state['shown'] - start)
+                save_samples.append(time.perf_counter() - state['save'])
+    finally:
+        driver.app.removeEventFilter(watcher)
+    return open_samples, save_samples
+
+
+def bench_dashboard_toggle(driver, steps):
+    dashboard_btn = driver.view.sidebar.dashboard_btn
+    notes_btn = driver.category_button("Notes")
+    to_dashboard, to_notes = [], []
+    for _ in range(steps):
+        to_dashboard.append(driver.timed(lambda: driver.click(dashboard_btn)))
+        to_notes.append(driver.timed(lambda: driver.click(notes_btn)))
+    return to_dashboard, to_notes
+
+
+def run(sizes, steps, seed):
+    from main import MainWindow
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    app.setQuitOnLastWindowClosed(False)
+    entries = []
+    with tempfile.TemporaryDirectory(prefix="scratchpad-ui-bench-") as workdir:
+        for size in sizes:
+            path = database_copy(size, workdir, seed)
+            window = MainWindow(db_path=path)
+            window.resize(800, 600)
+            window.show()
+            driver = UiDriver(window)
+            driver.settle()
+            rng = random.Random(seed)
+            try:
+                results = {'category switch': bench_category_switch(driver, steps, rng),
+                           'arrow-key selection': bench_arrow_selection(driver, steps)}
+                results['editor open'], results['editor save'] = bench_editor(driver, max(1, steps // 5))
+                results['dashboard show'], results['dashboard hide'] = bench_dashboard_toggle(driver, max(1, steps // 5))
+            finally:
+                window.close()
+                window.async_model.shutdown()
+                window.model.close()
+                window.deleteLater()
+                app.processEvents()
+            for op, samples in results.items():
+                if not samples:
+                    continue
+                entries.append({'size': size, 'mode': "ui", 'op': op, **summarize(samples)})
+                e = entries[-1]
+                print(f"{size:>7} {op:<22} p50 {e['p50_ms']:>9.2f} ms  p95 {e['p95_ms']:>9.2f} ms"
+                      f"  p99 {e['p99_ms']:>9.2f} ms", file=sys.stderr)
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.ui_bench", description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--steps", type=int, default=100, help="interactions per scenario (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="ui_bench.json", help="results file (default: %(default)s)")
+    parser.add_argument("--compare", metavar="BASELINE", help="print p50 ratios against an earlier results file")
+    args = parser.parse_args(argv)
+
+    entries = run(args.sizes, args.steps, args.seed)
+    report = {
+        'meta': {
+            'benchmark': "ui",
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'qt_platform': os.environ.get("QT_QPA_PLATFORM"),
+            'platform': platform.platform(),
+            'steps': args.steps,
+            'seed': args.seed,
+        },
+        'results': entries,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {args.out}", file=sys.stderr)
+
+    if args.compare:
+        compare(entries, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,6 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QCheckBox, QMessageBox
 
 from helpers.tooltip import ToolTip
-from views.components.editor_panel import EditorPanel
 from helpers.reselect_note import _reselect_note_in_list
 
 
@@ -15,8 +14,11 @@ class NoteController:
         self.sidebar = sidebar
         self.main_window = main_window
         self.dashboard_view = dashboard_view
+        # Model calls run on the view's worker thread; results come back as callbacks
+        self.async_model = view.async_model
+        # Current category and selection live in the view's Navigation
+        self.navigation = view.navigation
 
-        self.current_category = None
         self.view._image_refs = []  # keep pixmaps alive for embedded images
 
         self._connect_signals()
@@ -29,21 +31,12 @@ class NoteController:
     def _connect_signals(self):
         """Connect UI signals to their corresponding controller handlers."""
         self.view.controller = self
-        self.sidebar.category_selected.connect(self.select_category)
+        # Sidebar and list selection go to Navigation (wired in MainView)
+        self.navigation.dashboard_opened.connect(self._on_dashboard_opened)
 
-        if hasattr(self.sidebar, "dashboard_btn"):
-            self.sidebar.dashboard_btn.clicked.connect(self.show_dashboard)
-
-        # Ensure single connections
-        try:
-            self.view.add_btn.clicked.disconnect()
-        except TypeError:
-            pass  # no previous connections
         self.view.add_btn.clicked.connect(self.add_note)
-
         self.view.edit_btn.clicked.connect(self.edit_note)
         self.view.delete_btn.clicked.connect(self.delete_note)
-        self.view.note_list.itemSelectionChanged.connect(self.on_note_select)
 
     def _setup_always_on_top_checkbox(self):
         """Add an 'Always on Top' toggle checkbox to the view."""
@@ -58,48 +51,42 @@ class NoteController:
     # Category / Dashboard
     # -------------------------------------------------------------------------
 
-    def select_category(self, category):
-        """Handle when a category is selected from the sidebar."""
-        if category == "Dashboard" and self.dashboard_view:
-            self.show_dashboard()
-            return
-
-        self.current_category = category
-        notes = self.model.get_notes(category) or []
-
-        self.view.populate_note_list(notes)
-        self.view.set_category_title(category)
-        self.view.show_notes()
-        if self.dashboard_view:
-            self.dashboard_view.hide()
+    @property
+    def current_category(self):
+        return self.navigation.category
 
-        self._clear_note_selection()
+    def select_category(self, category):
+        """Open a category ("Dashboard" opens the dashboard)."""
+        self.navigation.select_category(category)
 
     def show_dashboard(self):
         """Show dashboard stats and hide the note editor."""
+        self.navigation.show_dashboard()
+
+    def _on_dashboard_opened(self):
         if not self.dashboard_view:
             return
-
-        self.current_category = None
-        self.view.set_category_title("Dashboard")
-        self.view.show_dashboard()
         self.dashboard_view.show()
         self.update_dashboard_stats()
-        self._clear_note_selection()
 
     def update_dashboard_stats(self):
         """Refresh dashboard data (counts, storage, etc.)."""
         if not self.dashboard_view:
             return
 
-        get_notes = lambda c: self.model.get_notes(c) or []
+        self.async_model.submit("get_category_stats", channel="dashboard_stats",
+                                callback=self._apply_dashboard_stats)
+
+    def _apply_dashboard_stats(self, category_stats):
+        counts = category_stats["categories"]
+        count = lambda c: counts.get(c, {}).get("count", 0)
 
         stats = {
-            "notes_count": len(get_notes("Notes")),
-            "contacts_count": len(get_notes("Contacts")),
-            "bookmarks_count": len(get_notes("Bookmarks")),
-            "copilot_count": len(get_notes("CoPilot")),
-            "tasks_completed": getattr(self.model, "count_completed_tasks", lambda: 0)(),
+            "notes_count": count("Notes"),
+            "contacts_count": count("Contacts"),
+            "bookmarks_count": count("Bookmarks"),
+            "copilot_count": count("CoPilot"),
+            "tasks_completed": category_stats["tasks_completed"],
             "storage_percent": getattr(self.model, "get_storage_usage_percent", lambda: 0)(),
         }
 
@@ -111,21 +98,7 @@ class NoteController:
 
     def get_selected_note_id(self):
         """Return the selected note’s ID from the note list."""
-        items = self.view.note_list.selectedItems()
-        if not items:
-            return None
-        return items[0].data(0, Qt.ItemDataRole.UserRole)
-
-    def on_note_select(self):
-        """Load selected note’s content into view cache."""
-        note_id = self.get_selected_note_id()
-        if note_id and self.current_category:
-            note = self.model.get_note_by_id(self.current_category, note_id)
-            if note:
-                self.view.current_note_id = note_id
-                self.view.current_note_content = note["content"]
-                return
-        self._clear_note_selection()
+        return self.view.selected_note_id()
 
     def _clear_note_selection(self):
         """Reset current note state in the view."""
@@ -148,20 +121,24 @@ class NoteController:
             QMessageBox.warning(self.main_window, "Warning", "Please select a note to edit.")
             return
 
-        note = self.model.get_note_by_id(self.current_category, note_id)
-        if not note:
-            QMessageBox.warning(self.main_window, "Warning", "Could not find this note.")
-            return
+        def _open(note):
+            if not note:
+                QMessageBox.warning(self.main_window, "Warning", "Could not find this note.")
+                return
+
+            # Store the ID so it persists after editing
+            self.view.current_note_id = note_id
 
-        # Store the ID so it persists after editing
-        self.view.current_note_id = note_id
+            # Open editor dialog
+            self._open_edit_dialog(
+                "Edit Note",
+                note["content"],
+                lambda content: self._edit_note_callback(note_id, content),
+                note_id=note_id
+            )
 
-        # Open editor dialog
-        self._open_edit_dialog(
-            "Edit Note",
-            note["content"],
-            lambda content: self._edit_note_callback(note_id, content)
-        )
+        self.async_model.submit("get_note_by_id", self.current_category, note_id,
+                                channel="editor", callback=_open)
 
     def delete_note(self):
         note_id = self.get_selected_note_id()
@@ -171,18 +148,59 @@ class NoteController:
 
         if QMessageBox.question(self.main_window, "Delete", "Are you sure you want to delete this note?") \
            == QMessageBox.StandardButton.Yes:
-            self.model.delete_note(self.current_category, note_id)
-            self.select_category(self.current_category)
-            if self.dashboard_view and self.current_category is None:
-                self.update_dashboard_stats()
+            self.async_model.submit("delete_note", self.current_category, note_id)
+            self.view.note_list_model.remove_note(note_id)
+            self.view.preview_renderer.clear()
+            self._clear_note_selection()
 
     # -------------------------------------------------------------------------
     # Private Helpers
     # -------------------------------------------------------------------------
 
-    def _open_edit_dialog(self, title, content, save_callback):
-        """Open the editor dialog for adding or editing notes."""
-        EditorPanel(self.main_window, title, content, save_callback).exec()
+    def _open_edit_dialog(self, title, content, save_callback, note_id=None):
+        """Open the editor dialog for adding or editing notes (note_id is None when adding)."""
+        from views.components.editor_panel import EditorPanel  # loaded on first use
+        journal = self.model.journals.open(note_id, self.current_category, content)
+        editor = EditorPanel(self.main_window, title, content, save_callback,
+                             attachment_store=self.model.attachments, journal=journal)
+        saved = editor.exec() == EditorPanel.Accepted
+        self._close_journal(journal, saved)
+
+    def _close_journal(self, journal, saved):
+        """Drop an editor's autosave journal; after a save, only once the save is on disk."""
+        if saved:
+            self.async_model.submit("flush_writes", callback=lambda _: journal.discard())
+        else:
+            journal.discard()
+
+    def recover_autosaves(self):
+        """Offer to restore editor changes that were never saved because the app stopped."""
+        self.async_model.submit("recover_autosaves", callback=self._offer_recovery)
+
+    def _offer_recovery(self, recovered):
+        if not recovered:
+            return
+        paths = [entry["path"] for entry in recovered]
+        restorable = [entry for entry in recovered if entry["content"].strip()]
+
+        if restorable and QMessageBox.question(
+            self.main_window, "Recover Notes",
+            f"{len(restorable)} note(s) had unsaved changes when Scribble Notes last closed.\n"
+            "Restore them?"
+        ) == QMessageBox.StandardButton.Yes:
+            for entry in restorable:
+                content = entry["content"].strip()
+                title = self._generate_title(content, entry["category"])
+                if entry["note_id"]:
+                    self.async_model.submit("edit_note", entry["category"], entry["note_id"], title, content)
+                else:
+                    self.async_model.submit("add_note", entry["category"], title, content)
+            self._refresh_notes_view()
+            self.update_dashboard_stats()
+
+        # Journals go once the restored notes are committed (or straight away if declined)
+        self.async_model.submit("flush_writes",
+                                callback=lambda _: [self.model.journals.remove(path) for path in paths])
 
     def _generate_title(self, content, category):
         """Generate a title from note content."""
@@ -196,27 +214,28 @@ class NoteController:
             QMessageBox.warning(self.main_window, "Warning", "Note content cannot be empty.")
             return
 
-        title = self._generate_title(content, self.current_category)
-        self.model.add_note(self.current_category, title, content)
-        self._refresh_notes_view()
+        category = self.current_category
+        title = self._generate_title(content, category)
+
+        def _added(note_id):
+            if self.current_category == category:
+                self.view.note_list_model.insert_note({"id": note_id, "title": title})
+
+        self.async_model.submit("add_note", category, title, content, callback=_added)
 
     def _edit_note_callback(self, note_id, content):
         # Derive new title from first line of content
         new_title = (content.strip().split('\n')[0][:30]) or "Untitled"
 
         # Update the model
-        self.model.edit_note(self.current_category, note_id, new_title, content)
+        self.async_model.submit("edit_note", self.current_category, note_id, new_title, content)
 
-        # Update the item title directly in the tree (instant UI update)
-        for i in range(self.view.note_list.topLevelItemCount()):
-            item = self.view.note_list.topLevelItem(i)
-            if item.data(0, Qt.ItemDataRole.UserRole) == note_id:
-                item.setText(0, new_title)
-                break
+        # Update the item title directly in the list (instant UI update)
+        self.view.note_list_model.update_title(note_id, new_title)
 
         # Update the content preview
         self.view.current_note_content = content
-        self.view.preview.setPlainText(content)
+        self.view.preview_renderer.show(note_id, content)
 
         # reselect the edited item so selection remains
         _reselect_note_in_list(self.view, note_id)
@@ -230,8 +249,7 @@ class NoteController:
         if not self.current_category:
             return
 
-        notes = self.model.get_notes(self.current_category)
-        self.view.populate_note_list(notes)
+        self.navigation.reload()
 
         if self.dashboard_view and self.current_category is None:
             self.update_dashboard_stats()
@@ -247,9 +265,5 @@ class NoteController:
 
     def _reselect_note_in_list(self, note_id):
         """Re-select a note in the list after it has been updated."""
-        for i in range(self.view.note_list.topLevelItemCount()):
-            item = self.view.note_list.topLevelItem(i)
-            if item.data(0, Qt.ItemDataRole.UserRole) == note_id:
-                self.view.note_list.setCurrentItem(item)
-                break
+        _reselect_note_in_list(self.view, note_id)
 
@@ -0,0 +1,130 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+
+DASHBOARD = "Dashboard"
+
+# Navigation events arriving within this window are applied together
+COALESCE_MS = 30
+
+_UNSET = object()
+
+
+class Navigation(QObject):
+    """
+    Owns what the window is showing: the current category (or the dashboard),
+    the search filter and the selected note.
+
+    Sidebar clicks, search and list selection are fed in through select_category,
+    show_dashboard, search and select_note. Requests are held for COALESCE_MS and
+    only the latest of each kind is applied, so a burst of clicks or held-down
+    arrow keys loads once. This is the only place navigation loads notes; views
+    and the controller react to the signals below instead of querying the model.
+    """
+
+    category_changed = Signal(str)      # a category was opened (list reload has started)
+    dashboard_opened = Signal()
+    note_loaded = Signal(object, object)  # note_id, note dict; (None, None) when cleared
+
+    def __init__(self, async_model, note_list_model, parent=None):
+        super().__init__(parent)
+        self.async_model = async_model
+        self.note_list_model = note_list_model
+        self.category = None  # None while the dashboard is shown
+        self.note_id = None
+        self.query = ""
+
+        self._pending_view = None
+        self._pending_query = None
+        self._pending_note = _UNSET
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(COALESCE_MS)
+        self._timer.timeout.connect(self._apply)
+
+    # ---------------- Requests ----------------
+    def select_category(self, category):
+        """Open a category ("Dashboard" opens the dashboard)."""
+        self._pending_view = category
+        self._pending_query = None
+        self._pending_note = _UNSET
+        self._schedule()
+
+    def show_dashboard(self):
+        self.select_category(DASHBOARD)
+
+    def search(self, query):
+        """Filter the current category's list with a full-text search ("" shows all)."""
+        self._pending_query = query
+        self._schedule()
+
+    def select_note(self, note_id):
+        """Select a note of the current category (None clears the selection)."""
+        self._pending_note = note_id
+        self._schedule()
+
+    def reload(self):
+        """Reload the current category's list from the first page, e.g. after an import."""
+        if self.category is not None:
+            self.note_list_model.set_category(self.category)
+
+    def is_pending(self):
+        """True while requests are waiting to be applied."""
+        return self._timer.isActive()
+
+    def _schedule(self):
+        # Not restarted by later events, so held-down keys still load every COALESCE_MS
+        if not self._timer.isActive():
+            self._timer.start()
+
+    # ---------------- Applying ----------------
+    def _apply(self):
+        view, self._pending_view = self._pending_view, None
+        query, self._pending_query = self._pending_query, None
+        note_id, self._pending_note = self._pending_note, _UNSET
+
+        if view == DASHBOARD:
+            self._clear_note()
+            self.category = None
+            self.query = ""
+            self.note_list_model.clear()
+            self.dashboard_opened.emit()
+            return
+        if view is not None:
+            self._clear_note()
+            self.category = view
+            self.query = ""
+            self.note_list_model.set_category(view)
+            self.category_changed.emit(view)
+        if query is not None and self.category is not None and query != self.query:
+            self._clear_note()
+            self.query = query
+            if query.strip():
+                self.async_model.submit("search", query, category=self.category,
+                                        channel="note_list", callback=self.note_list_model.set_rows)
+            else:
+                self.note_list_model.set_category(self.category)
+        if note_id is not _UNSET and note_id != self.note_id:
+            self._load_note(note_id)
+
+    def _clear_note(self):
+        self.async_model.cancel("preview")
+        if self.note_id is not None:
+            self.note_id = None
+            self.note_loaded.emit(None, None)
+
+    def _load_note(self, note_id):
+        if note_id is None or self.category is None:
+            self._clear_note()
+            return
+        self.note_id = note_id
+        # Selecting another note before this one arrives cancels it
+        self.async_model.submit("get_note_by_id", self.category, note_id,
+                                channel="preview", callback=lambda note: self._loaded(note_id, note))
+
+    def _loaded(self, note_id, note):
+        if note_id != self.note_id:
+            return
+        if not note:
+            self.note_id = None
+            self.note_loaded.emit(None, None)
+            return
+        self.note_loaded.emit(note_id, note)
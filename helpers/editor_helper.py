@@ -1,56 +1,67 @@
-from PySide6.QtCore import Qt, QSignalBlocker
-from views.components.editor_panel import EditorPanel
+from PySide6.QtCore import QSignalBlocker
 
 
-def open_note_editor(main_view, item, category):
+def open_note_editor(main_view, note_id, category):
     """Opens the full EditorPanel popup for editing a note."""
-    if item is None or category is None:
+    if note_id is None or category is None:
         return
 
     # 🟢 Prevent reopening if already open
     if getattr(main_view, "_editor_open", False):
         return
 
-    note_id = item.data(0, Qt.ItemDataRole.UserRole)
-    note = main_view.note_model.get_note_by_id(category, note_id)
-    if not note:
+    main_view.async_model.submit(
+        "get_note_by_id", category, note_id,
+        channel="editor", callback=lambda note: _open_loaded_note(main_view, category, note_id, note)
+    )
+
+
+def _open_loaded_note(main_view, category, note_id, note):
+    """Opens the editor once the note has been loaded off the main thread."""
+    if not note or getattr(main_view, "_editor_open", False):
         return
 
+    from views.components.editor_panel import EditorPanel  # loaded on first use
+
     def _title_from_content(content):
         first = content.strip().split("\n")[0] if content.strip() else ""
         return first[:30] if first else "Untitled"
 
-    def _update_tree_item_title(note_id, new_title):
-        for i in range(main_view.note_list.topLevelItemCount()):
-            it = main_view.note_list.topLevelItem(i)
-            if it.data(0, Qt.ItemDataRole.UserRole) == note_id:
-                it.setText(0, new_title)
-                return
-
     def save_callback(new_content):
         """Save button handler — no reopen bug."""
         new_title = _title_from_content(new_content)
-        main_view.note_model.edit_note(category, note_id, new_title, new_content)
+        main_view.async_model.submit("edit_note", category, note_id, new_title, new_content)
         main_view.current_note_id = note_id
         main_view.current_note_content = new_content
-        main_view.preview.setPlainText(new_content)
-        _update_tree_item_title(note_id, new_title)
+        main_view.preview_renderer.show(note_id, new_content)
+        main_view.note_list_model.update_title(note_id, new_title)
 
     # Block signals temporarily to prevent re-entry
     with QSignalBlocker(main_view.note_list):
         # 🟩 Mark editor open
         main_view._editor_open = True
 
+        # Unsaved edits are journaled so a crash doesn't lose them
+        journal = main_view.note_model.journals.open(note_id, category, note["content"])
+
         # Create the original EditorPanel dialog
         editor = EditorPanel(
             parent=main_view,
             title=f"Edit Note: {note['title']}",
             content=note["content"],
-            save_callback=save_callback
+            save_callback=save_callback,
+            attachment_store=main_view.note_model.attachments,
+            journal=journal
         )
 
         # When it closes, clear the guard
         editor.finished.connect(lambda _: setattr(main_view, "_editor_open", False))
 
         # Open editor modally
-        editor.exec()
+        saved = editor.exec() == EditorPanel.Accepted
+
+    # The journal is only dropped once the save has reached the database
+    if saved:
+        main_view.async_model.submit("flush_writes", callback=lambda _: journal.discard())
+    else:
+        journal.discard()
@@ -0,0 +1,96 @@
+from collections import Counter
+
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtWidgets import QFileDialog, QInputDialog, QMessageBox, QProgressDialog
+
+from models.importer import DEFAULT_CATEGORY, ImportCancelled, iter_source
+
+
+class _ImportProgress(QObject):
+    """Carries the running count from the worker thread to the progress dialog."""
+
+    advanced = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cancelled = False
+
+    def report(self, count):
+        # Runs on the worker thread, between batches
+        if self.cancelled:
+            raise ImportCancelled()
+        self.advanced.emit(count)
+
+
+def _counted(records, counts):
+    """Pass records through, tallying them per category (on the import thread)."""
+    for record in records:
+        counts[record['category']] += 1
+        yield record
+
+
+def _summary(counts):
+    total = sum(counts.values())
+    if len(counts) <= 1:
+        return f"Imported {total} notes" + (f" into {next(iter(counts))}." if counts else ".")
+    lines = "\n".join(f"{category}: {count}" for category, count in counts.most_common())
+    return f"Imported {total} notes into {len(counts)} categories:\n{lines}"
+
+
+def import_notes(main_window, folder=False):
+    """
+    Ask for a .jsonl file (or a folder of .md/.txt files) and import it on the
+    job thread, which has its own connection, so the UI keeps loading notes.
+    """
+    if folder:
+        path = QFileDialog.getExistingDirectory(main_window, "Import Folder of Notes")
+    else:
+        path, _ = QFileDialog.getOpenFileName(
+            main_window, "Import Notes", "", "JSON Lines (*.jsonl *.ndjson)"
+        )
+    if not path:
+        return
+
+    categories = [btn.text() for btn in main_window.view.sidebar.category_buttons]
+    current = main_window.controller.current_category or DEFAULT_CATEGORY
+    label = "Category for imported notes:" if folder else "Category for notes that don't name one:"
+    category, ok = QInputDialog.getItem(
+        main_window, "Import Notes", label,
+        categories, categories.index(current) if current in categories else 0, False
+    )
+    if not ok:
+        return
+
+    try:
+        counts = Counter()
+        records = _counted(iter_source(path, category), counts)
+    except ValueError as e:
+        QMessageBox.warning(main_window, "Import Notes", str(e))
+        return
+
+    dialog = QProgressDialog("Importing notes…", "Cancel", 0, 0, main_window)
+    dialog.setWindowTitle("Import Notes")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(300)
+
+    progress = _ImportProgress(dialog)
+    progress.advanced.connect(lambda count: dialog.setLabelText(f"Imported {count} notes…"))
+    dialog.canceled.connect(lambda: setattr(progress, "cancelled", True))
+
+    def _done(count):
+        dialog.reset()
+        dialog.deleteLater()
+        main_window.controller._refresh_notes_view()
+        main_window.controller.update_dashboard_stats()
+        QMessageBox.information(main_window, "Import Notes", _summary(counts))
+
+    def _failed(error):
+        dialog.reset()
+        dialog.deleteLater()
+        if not isinstance(error, ImportCancelled):
+            QMessageBox.critical(main_window, "Import Notes", f"Import failed, nothing was imported:\n{error}")
+
+    main_window.async_model.run_job(
+        "import_notes", records, progress=progress.report,
+        callback=_done, error_callback=_failed
+    )
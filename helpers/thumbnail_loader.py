@@ -0,0 +1,93 @@
+import hashlib
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader, QColor
+
+THUMBNAIL_SIZE = 50
+
+# Content-addressed attachments are already named by their SHA-256
+_HASH_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+# Shared by every loader; decoding is I/O and libpng/libjpeg bound
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbnails")
+
+
+def placeholder_image(size=THUMBNAIL_SIZE):
+    """Neutral square shown until the real thumbnail is ready."""
+    image = QImage(size, size, QImage.Format_ARGB32)
+    image.fill(QColor(200, 200, 200))
+    return image
+
+
+class ThumbnailLoader(QObject):
+    """
+    Produces small thumbnails of image files off the GUI thread.
+
+    Thumbnails are cached on disk under <cache_dir>/<file hash>_<size>.png, so
+    each image is decoded at full resolution at most once. Missing ones are
+    decoded with QImageReader's scaled reading on a worker thread and delivered
+    through thumbnail_ready on the GUI thread.
+    """
+
+    thumbnail_ready = Signal(str, QImage)  # source path, thumbnail
+
+    def __init__(self, cache_dir, size=THUMBNAIL_SIZE, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.size = size
+
+    def request(self, path):
+        """Start loading the thumbnail for an image file."""
+        _executor.submit(self._load, path)
+
+    def _cache_path(self, path):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if not _HASH_NAME.match(stem):
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            stem = digest.hexdigest()
+        return os.path.join(self.cache_dir, f"{stem}_{self.size}.png")
+
+    def _decode(self, path):
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        full_size = reader.size()
+        if full_size.isValid():
+            # Let the decoder scale while reading instead of decoding full resolution
+            reader.setScaledSize(full_size.scaled(self.size, self.size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if not image.isNull() and (image.width() > self.size or image.height() > self.size):
+            image = image.scaled(self.size, self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+    def _store(self, cache_path, image):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".png")
+        os.close(fd)
+        if image.save(tmp_path, "PNG"):
+            os.replace(tmp_path, cache_path)
+        else:
+            os.remove(tmp_path)
+
+    def _load(self, path):
+        try:
+            cache_path = self._cache_path(path)
+            image = QImage(cache_path) if os.path.exists(cache_path) else QImage()
+            if image.isNull():
+                image = self._decode(path)
+                if not image.isNull():
+                    self._store(cache_path, image)
+        except OSError:
+            return
+        if image.isNull():
+            return
+        try:
+            self.thumbnail_ready.emit(path, image)
+        except RuntimeError:
+            pass  # the editor that asked for it has been closed
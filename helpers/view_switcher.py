@@ -7,8 +7,4 @@ class ViewSwitcher:
 
     def on_sidebar_select(self, category):
         self.controller.view = self.main_window.view
-
-        if category == "Dashboard":
-            self.controller.show_dashboard()
-        else:
-            self.controller.select_category(category)
+        self.controller.select_category(category)
@@ -1,14 +1,47 @@
-from PySide6.QtGui import QPalette, QColor
-from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
-from controllers.controller import NoteController
-from models.model import NoteModel
-from views.main_view import MainView
-from helpers.view_switcher import ViewSwitcher
-
 import sys
 
+from utils.startup_profiler import profiler
+from utils.instrumentation import instrumentation
+
+# Enabled before the imports below so they show up in the report
+profiler.enabled = "--profile-startup" in sys.argv
+# Method/SQL timers and the slow query log; off (and not installed at all) by default
+instrumentation.enabled = "--instrument" in sys.argv
+
+with profiler.span("import PySide6"):
+    from PySide6.QtCore import QTimer
+    from PySide6.QtGui import QPalette, QColor
+    from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
+with profiler.span("import models"):
+    from models.model import NoteModel
+    from models.async_model import AsyncNoteModel
+with profiler.span("import views"):
+    from views.main_view import MainView
+with profiler.span("import controllers"):
+    from controllers.controller import NoteController
+    from helpers.view_switcher import ViewSwitcher
+    from utils.stall_watchdog import StallWatchdog
+
+# Delay before the background attachment garbage collection pass
+ATTACHMENT_GC_DELAY_MS = 10_000
+
+# Note writes are group-committed this often (seconds); see models/write_behind.py
+WRITE_BEHIND_INTERVAL = 0.5
+
+SLOW_QUERY_LOG = "data/slow_queries.log"
+# Main thread stalls longer than STALL_THRESHOLD_MS are logged here with the blocking stack
+STALL_LOG = "data/stalls.log"
+STALL_THRESHOLD_MS = 100
+
+if instrumentation.enabled:
+    # Patched before anything is constructed, so signal connections see the timed methods
+    instrumentation.instrument_class(NoteModel)
+    instrumentation.instrument_class(NoteController)
+    instrumentation.log_to(SLOW_QUERY_LOG)
+
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, db_path="data/notes.db"):
         super().__init__()
         self.setWindowTitle("Scribble Notes")
 
@@ -23,22 +56,29 @@ class MainWindow(QMainWindow):
         self.layout = QVBoxLayout(self.central_widget)
 
         # Create model
-        self.model = NoteModel()
+        with profiler.span("NoteModel (open database, schema)"):
+            self.model = NoteModel(db_path, write_behind_interval=WRITE_BEHIND_INTERVAL)
+            self.async_model = AsyncNoteModel(self.model, parent=self)
+            if instrumentation.enabled:
+                self.model.db.set_trace_callback(instrumentation.trace, instrumentation.end_statement)
 
-        # Create main view, which already contains dashboard_view inside its layout
-        self.view = MainView()
+        # Create main view, which already contains dashboard_view inside its layout.
+        # It shares the window's model (and so its database connection).
+        with profiler.span("MainView"):
+            self.view = MainView(model=self.model, async_model=self.async_model)
 
         # Add main view to layout
         self.layout.addWidget(self.view)
 
         # Controller uses dashboard_view from the main view directly
-        self.controller = NoteController(
-            model=self.model,
-            view=self.view,
-            sidebar=self.view.sidebar,
-            main_window=self,
-            dashboard_view=self.view.dashboard_container.dashboard_view  # Use dashboard_view from MainView
-        )
+        with profiler.span("NoteController"):
+            self.controller = NoteController(
+                model=self.model,
+                view=self.view,
+                sidebar=self.view.sidebar,
+                main_window=self,
+                dashboard_view=self.view.dashboard_container.dashboard_view  # Use dashboard_view from MainView
+            )
 
         # View Switcher
         self.view_switcher = ViewSwitcher(self, self.controller)
@@ -46,11 +86,67 @@ class MainWindow(QMainWindow):
         # Start on Dashboard
         self.view_switcher.on_sidebar_select("Dashboard")
 
+        self._create_menus()
+
+        # Offer back editor changes left unsaved by a crash (asks once the window is up)
+        self.controller.recover_autosaves()
+
+        # Reclaim unreferenced attachment files on the worker once startup has settled
+        QTimer.singleShot(ATTACHMENT_GC_DELAY_MS, lambda: self.async_model.submit("collect_attachment_garbage"))
+
+    def _create_menus(self):
+        file_menu = self.menuBar().addMenu("&File")
+        file_menu.addAction("Import Notes (JSONL)…", lambda: self._import_notes(folder=False))
+        file_menu.addAction("Import Folder (Markdown / Text)…", lambda: self._import_notes(folder=True))
+
+        if instrumentation.enabled:
+            debug_menu = self.menuBar().addMenu("&Debug")
+            debug_menu.addAction("Performance Counters…", self._show_counters)
+            debug_menu.addAction("Dump Counters to JSON…", self._dump_counters)
+
+    def _show_counters(self):
+        from views.components.debug_panel import InstrumentationPanel
+        if getattr(self, "_counters_panel", None) is None:
+            self._counters_panel = InstrumentationPanel(instrumentation, parent=self)
+        self._counters_panel.show()
+        self._counters_panel.raise_()
+
+    def _dump_counters(self):
+        from PySide6.QtWidgets import QFileDialog
+        from views.components.debug_panel import dump_counters
+        path, _ = QFileDialog.getSaveFileName(self, "Dump Counters", "counters.json", "JSON (*.json)")
+        if path:
+            dump_counters(self, instrumentation, path)
+
+    def _import_notes(self, folder):
+        from helpers.import_helper import import_notes  # loaded on first use
+        import_notes(self, folder=folder)
+
+    def closeEvent(self, event):
+        # Don't leave edits sitting in the write-behind queue once the window is gone
+        self.model.flush_writes()
+        super().closeEvent(event)
+
 def main():
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    with profiler.span("QApplication"):
+        app = QApplication(sys.argv)
+    with profiler.span("MainWindow"):
+        window = MainWindow()
+    # Sticky notes still open save as they close; then drain queued writes
+    # on the worker before closing the database
+    app.aboutToQuit.connect(window.view.dashboard_container.dashboard_view.close_sticky_notes)
+    app.aboutToQuit.connect(window.async_model.shutdown)
+    app.aboutToQuit.connect(window.model.close)
     window.resize(800, 600)
-    window.show()
+    with profiler.span("show first window"):
+        window.show()
+    # Runs on the first event loop iteration, i.e. once the window can take input
+    QTimer.singleShot(0, profiler.report)
+    # Started after startup so the (expected) slow first show is not reported
+    StallWatchdog.log_to(STALL_LOG)
+    watchdog = StallWatchdog(threshold_ms=STALL_THRESHOLD_MS, parent=app)
+    QTimer.singleShot(0, watchdog.start)
+    app.aboutToQuit.connect(watchdog.stop)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal
+
+
+class _Request:
+    """Book-keeping for one submitted call."""
+
+    __slots__ = ("callback", "error_callback", "channel", "cancelled", "future")
+
+    def __init__(self, callback, error_callback, channel):
+        self.callback = callback
+        self.error_callback = error_callback
+        self.channel = channel
+        self.cancelled = False
+        self.future = None
+
+
+class AsyncNoteModel(QObject):
+    """
+    Runs NoteModel calls on a dedicated worker thread and delivers the results
+    back on the Qt main thread.
+
+    Calls may be tagged with a channel (e.g. "note_list"). Submitting to a channel
+    cancels the previous request on it, so when the user switches category before
+    a load finishes the stale result is dropped instead of being shown.
+    The single worker also keeps writes and later reads in submission order.
+    Long jobs such as imports go through run_job() instead, on a thread (and
+    so a connection) of their own, leaving the worker free to serve reads.
+    """
+
+    _finished = Signal(object, object, object)  # request, result, error
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="note-db")
+        self._jobs = ThreadPoolExecutor(max_workers=1, thread_name_prefix="note-job")
+        self._channels = {}
+        self._in_flight = set()  # submitted, result not delivered yet
+        self._shut_down = False
+        # Emitted from the worker thread, so Qt queues delivery onto our (main) thread
+        self._finished.connect(self._deliver)
+
+    def submit(self, method, *args, callback=None, error_callback=None, channel=None, **kwargs):
+        """Call model.<method>(*args, **kwargs) on the worker; callback(result) runs on the main thread."""
+        if self._shut_down:
+            # Late calls (e.g. a window saving in closeEvent during exit) run inline
+            result = getattr(self.model, method)(*args, **kwargs)
+            if callback is not None:
+                callback(result)
+            return None
+        request = _Request(callback, error_callback, channel)
+        self._in_flight.add(request)
+        if channel is not None:
+            self.cancel(channel)
+            self._channels[channel] = request
+        request.future = self._executor.submit(self._run, request, method, args, kwargs)
+        return request.future
+
+    def run_job(self, method, *args, callback=None, error_callback=None, **kwargs):
+        """
+        Like submit(), but on the job thread: the call may run alongside the
+        worker's, so it must not depend on their order (no channels).
+        """
+        if self._shut_down:
+            raise RuntimeError("AsyncNoteModel has been shut down")
+        request = _Request(callback, error_callback, None)
+        self._in_flight.add(request)
+        request.future = self._jobs.submit(self._run, request, method, args, kwargs)
+        return request.future
+
+    def cancel(self, channel):
+        """Cancel the pending request on a channel; its callback will not run."""
+        request = self._channels.pop(channel, None)
+        if request is not None:
+            request.cancelled = True
+            if request.future.cancel():
+                self._in_flight.discard(request)  # never ran, so nothing will be delivered
+
+    def shutdown(self, wait=True):
+        """Stop accepting work; by default block until queued writes have run."""
+        for channel in list(self._channels):
+            self.cancel(channel)
+        self._shut_down = True
+        self._jobs.shutdown(wait=wait)
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, request, method, args, kwargs):
+        if request.cancelled:
+            self._finished.emit(request, None, None)
+            return None
+        try:
+            result = getattr(self.model, method)(*args, **kwargs)
+        except Exception as e:
+            self._finished.emit(request, None, e)
+            raise
+        self._finished.emit(request, result, None)
+        return result
+
+    def is_idle(self):
+        """True when every submitted call has run and its callback has been delivered."""
+        return not self._in_flight
+
+    def _deliver(self, request, result, error):
+        self._in_flight.discard(request)
+        if request.channel is not None and self._channels.get(request.channel) is request:
+            del self._channels[request.channel]
+        if request.cancelled:
+            return
+        if error is not None:
+            if request.error_callback is not None:
+                request.error_callback(error)
+                return
+            raise error
+        if request.callback is not None:
+            request.callback(result)
@@ -0,0 +1,137 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+
+# An embedded image is a line of its own: [image:<file name>]
+IMAGE_TAG = re.compile(r"^\[image:([^\]\r\n]+)\]\s*$", re.MULTILINE)
+
+# Files the store manages: content-addressed blobs, plus the uuid4-named copies
+# written by older versions (both are safe to collect once unreferenced).
+BLOB_NAME = re.compile(r"^[0-9a-f]{64}\.[A-Za-z0-9]+$")
+LEGACY_NAME = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.[A-Za-z0-9]+$")
+
+# Thumbnail cache (helpers/thumbnail_loader.py): <THUMBNAIL_DIR>/<image sha256>_<size>.png
+THUMBNAIL_DIR = "thumbnails"
+THUMBNAIL_NAME = re.compile(r"^([0-9a-f]{64})_\d+\.png$")
+
+# Blobs younger than this are never collected: an image inserted into an editor
+# that hasn't been saved yet has no reference row.
+GC_GRACE_SECONDS = 24 * 60 * 60
+
+_READ_CHUNK = 1024 * 1024
+
+
+def find_attachments(content):
+    """Return the set of attachment names referenced by note content."""
+    if not content or "[image:" not in content:
+        return set()
+    return {os.path.basename(name) for name in IMAGE_TAG.findall(content)}
+
+
+class AttachmentStore:
+    """
+    Image attachments stored once per distinct content, named by SHA-256.
+    Blobs are immutable, so any number of notes can share one file.
+    """
+
+    def __init__(self, root="data"):
+        self.root = root
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    @property
+    def thumbnail_dir(self):
+        return os.path.join(self.root, THUMBNAIL_DIR)
+
+    @staticmethod
+    def _digest(source_path):
+        digest = hashlib.sha256()
+        with open(source_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def put(self, source_path):
+        """Store a file (if its content isn't stored yet) and return its attachment name."""
+        ext = os.path.splitext(source_path)[1].lower()
+        name = f"{self._digest(source_path)}{ext}"
+        target = self.path(name)
+
+        if os.path.exists(target):
+            os.utime(target)  # restart the GC grace period for the new reference
+            return name
+
+        os.makedirs(self.root, exist_ok=True)
+        # Copy to a temp file and rename, so a blob is never visible half-written
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp, open(source_path, "rb") as src:
+                shutil.copyfileobj(src, tmp, _READ_CHUNK)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return name
+
+    def collect_garbage(self, referenced, grace_seconds=GC_GRACE_SECONDS):
+        """
+        Delete managed files not in `referenced` and older than the grace period,
+        then the thumbnails (same grace period) of images no longer stored.
+        Returns the removed names; thumbnails as THUMBNAIL_DIR/<name>.
+        """
+        if not os.path.isdir(self.root):
+            return []
+        cutoff = time.time() - grace_seconds
+        removed = []
+        kept = []
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                name = entry.name
+                if not entry.is_file() or not (BLOB_NAME.match(name) or LEGACY_NAME.match(name)):
+                    continue
+                if name in referenced or entry.stat().st_mtime > cutoff:
+                    kept.append(name)
+                    continue
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    kept.append(name)
+                    continue
+                removed.append(name)
+        removed.extend(self._collect_thumbnails(kept, cutoff))
+        return removed
+
+    def _collect_thumbnails(self, kept, cutoff):
+        if not os.path.isdir(self.thumbnail_dir):
+            return []
+        orphans = []
+        with os.scandir(self.thumbnail_dir) as entries:
+            for entry in entries:
+                match = THUMBNAIL_NAME.match(entry.name)
+                if match and entry.is_file() and entry.stat().st_mtime <= cutoff:
+                    orphans.append((entry, match.group(1)))
+        if not orphans:
+            return []
+        # Blobs are named by their hash; older uuid-named copies have to be hashed
+        hashes = {os.path.splitext(name)[0] for name in kept if BLOB_NAME.match(name)}
+        for name in kept:
+            if LEGACY_NAME.match(name):
+                try:
+                    hashes.add(self._digest(self.path(name)))
+                except OSError:
+                    continue
+        removed = []
+        for entry, digest in orphans:
+            if digest in hashes:
+                continue
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            removed.append(f"{THUMBNAIL_DIR}/{entry.name}")
+        return removed
@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+
+
+class ContentCache:
+    """
+    Least-recently-used cache of note rows, bounded by the UTF-8 size of their
+    text rather than the number of entries. Shared by every caller of a NoteModel,
+    including the async worker thread, so all access is locked.
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; a read that started before a write must
+        # not put its (now stale) row back into the cache.
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _utf8_len(text):
+        return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+    @classmethod
+    def _size(cls, note):
+        return cls._utf8_len(note["title"]) + cls._utf8_len(note["content"])
+
+    def get(self, note_id):
+        """Return a copy of the cached note, or None."""
+        with self._lock:
+            entry = self._entries.get(note_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(note_id)
+            self.hits += 1
+            return dict(entry[0])
+
+    def put(self, note_id, note, generation, size=None):
+        """
+        Cache a note read while the cache was at `generation`. size is its
+        title and content in UTF-8 bytes, if the caller already knows it.
+        """
+        if size is None:
+            size = self._size(note)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            old = self._entries.pop(note_id, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[note_id] = (dict(note), size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, note_id):
+        with self._lock:
+            self.generation += 1
+            old = self._entries.pop(note_id, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Counters for tuning max_bytes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,42 @@
+import zlib
+
+# notes.codec values: how notes.content is stored
+CODEC_PLAIN = 0   # TEXT as typed
+CODEC_ZLIB = 1    # BLOB, zlib-compressed UTF-8
+
+# Bodies smaller than this (UTF-8 bytes) are stored as plain text: they fit a
+# page anyway, and plain rows stay readable with any SQLite tool. Other tools
+# can also write plain rows (codec 0); see NoteModel for what they don't update.
+COMPRESS_MIN_BYTES = 4096
+COMPRESS_LEVEL = 6
+
+# Keep the compressed form only if it saves at least this fraction
+MIN_SAVING = 0.1
+
+
+def encode_content(content):
+    """Return (stored value, codec) for a note body."""
+    data = content.encode("utf-8")
+    if len(data) < COMPRESS_MIN_BYTES:
+        return content, CODEC_PLAIN
+    packed = zlib.compress(data, COMPRESS_LEVEL)
+    if len(packed) > len(data) * (1 - MIN_SAVING):
+        return content, CODEC_PLAIN  # already dense (e.g. base64); not worth inflating on read
+    return packed, CODEC_ZLIB
+
+
+def encode_note(content):
+    """
+    Return (stored value, codec, text_bytes) for notes.content/codec/text_bytes.
+    text_bytes, the UTF-8 size as typed, is only stored for compressed bodies;
+    for plain ones SQL reads it off the value itself.
+    """
+    value, codec = encode_content(content)
+    return value, codec, (len(content.encode("utf-8")) if codec != CODEC_PLAIN else None)
+
+
+def decode_content(value, codec):
+    """Inverse of encode_content(); also the note_text() SQL function."""
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(value).decode("utf-8")
+    return value
@@ -0,0 +1,205 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Pragma profiles applied to every new connection.
+PRAGMA_PROFILES = {
+    # Interactive desktop use: WAL lets readers run alongside a writer and
+    # synchronous=NORMAL only fsyncs at checkpoints, which is safe in WAL mode.
+    "default": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,         # KiB (negative) -> ~16 MB page cache
+        "mmap_size": 64 * 1024 * 1024,
+        "busy_timeout": 5000,         # ms to wait for a concurrent writer
+        "temp_store": "MEMORY",
+    },
+    # Every commit is fsynced; for shared or network-backed deployments.
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,
+        "mmap_size": 0,
+        "busy_timeout": 10000,
+        "temp_store": "MEMORY",
+    },
+    # Large one-off jobs (imports, benchmarks) where speed matters more than durability.
+    "bulk": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+    },
+}
+
+# Size of each connection's prepared statement cache.
+STATEMENT_CACHE_SIZE = 256
+
+
+class Database:
+    """
+    Owns the SQLite connections for one database file: one connection per thread,
+    all opened in autocommit mode so plain reads never start a transaction.
+    Writes go through transaction().
+    """
+
+    def __init__(self, db_path, profile="default"):
+        if profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unknown pragma profile: {profile}")
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self.profile = profile
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._functions = []
+        self._setups = {}
+        self._trace_callback = None
+        self._trace_end = None
+        self._users = 0  # holders from get_database(), guarded by _databases_lock
+
+    @property
+    def connection(self):
+        """The calling thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,           # autocommit; transactions are explicit
+            check_same_thread=False,        # only so close() can run from any thread
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for name, value in PRAGMA_PROFILES[self.profile].items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        with self._lock:
+            for name, num_params, func in self._functions:
+                conn.create_function(name, num_params, func, deterministic=True)
+            for setup in self._setups.values():
+                setup(conn)
+            if self._trace_callback is not None:
+                conn.set_trace_callback(self._trace_callback)
+            self._connections.append(conn)
+        return conn
+
+    def create_function(self, name, num_params, func):
+        """Register a deterministic SQL function on every connection, current and future."""
+        with self._lock:
+            self._functions.append((name, num_params, func))
+            connections = list(self._connections)
+        for conn in connections:
+            conn.create_function(name, num_params, func, deterministic=True)
+
+    def add_connection_setup(self, name, setup):
+        """
+        Run setup(conn) on every connection, current and future (e.g. to create
+        TEMP triggers). A name that is already registered is ignored, so every
+        model sharing this Database can register its setup.
+        """
+        with self._lock:
+            if name in self._setups:
+                return
+            self._setups[name] = setup
+            connections = list(self._connections)
+        for conn in connections:
+            setup(conn)
+
+    def set_trace_callback(self, callback, end_callback=None):
+        """
+        Pass every statement's SQL to callback (None to stop), on every connection.
+        end_callback() runs on the same thread after each transaction commits or
+        rolls back, since no further statement marks where the last one ended.
+        """
+        with self._lock:
+            self._trace_callback = callback
+            self._trace_end = end_callback if callback is not None else None
+            connections = list(self._connections)
+        for conn in connections:
+            conn.set_trace_callback(callback)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block in a write transaction on this thread's connection.
+        Nested calls become savepoints, so callers can compose freely.
+        """
+        conn = self.connection
+        depth = self._local.depth
+        savepoint = f"sp_{depth}"
+        conn.execute("BEGIN IMMEDIATE" if depth == 0 else f"SAVEPOINT {savepoint}")
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth = depth
+            if depth == 0:
+                conn.execute("ROLLBACK")
+                self._ended()
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        else:
+            self._local.depth = depth
+            conn.execute("COMMIT" if depth == 0 else f"RELEASE {savepoint}")
+            if depth == 0:
+                self._ended()
+
+    def _ended(self):
+        end = self._trace_end
+        if end is not None:
+            end()
+
+    def close(self):
+        """Close every connection opened by this manager."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+_databases = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(db_path="data/notes.db", profile="default"):
+    """
+    Return the shared Database for a file, creating it on first use. Each call
+    must be paired with release_database(). Asking for a file that is already
+    open under another pragma profile raises ValueError, since its connections
+    were set up for that profile.
+    """
+    key = os.path.abspath(db_path)
+    with _databases_lock:
+        db = _databases.get(key)
+        if db is None:
+            db = Database(db_path, profile)
+            _databases[key] = db
+        elif db.profile != profile:
+            raise ValueError(f"{db_path} is already open with the {db.profile!r} profile, not {profile!r}")
+        db._users += 1
+        return db
+
+
+def release_database(db):
+    """Drop one get_database() hold; the last one closes the Database."""
+    with _databases_lock:
+        db._users -= 1
+        if db._users > 0:
+            return
+        key = os.path.abspath(db.db_path)
+        if _databases.get(key) is db:
+            del _databases[key]
+    db.close()
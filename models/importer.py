@@ -0,0 +1,133 @@
+"""
+Bulk import of notes from JSONL files, Markdown folders and plain-text folders.
+
+Sources are read lazily and handed to NoteModel.import_notes() a batch at a
+time, so memory stays bounded by the batch size whatever the input size.
+
+    python -m models.importer notes.jsonl
+    python -m models.importer ~/wiki --category Notes --db data/notes.db
+"""
+import argparse
+import json
+import os
+import sys
+from itertools import islice
+
+DEFAULT_CATEGORY = "Notes"
+IMPORT_BATCH_SIZE = 1000
+TITLE_MAX_CHARS = 30  # same cut-off the editor uses for titles
+
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+TEXT_SUFFIXES = (".txt",)
+
+
+class ImportCancelled(Exception):
+    """Raised by a progress callback to abandon an import (nothing is kept)."""
+
+
+def _title_from(content, fallback):
+    for line in content.splitlines():
+        line = line.strip().lstrip("#").strip()
+        if line:
+            return line[:TITLE_MAX_CHARS]
+    return fallback[:TITLE_MAX_CHARS] or "Untitled"
+
+
+def iter_jsonl(path, category=DEFAULT_CATEGORY):
+    """
+    One note per line: {"content": ..., "title"?: ..., "category"?: ...}.
+    Blank lines are skipped; a line that isn't a JSON object raises ValueError.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record, dict) or not isinstance(record.get("content"), str):
+                raise ValueError(f"{path}:{line_no}: expected an object with a 'content' string")
+            content = record["content"]
+            yield {
+                'category': record.get("category") or category,
+                'title': record.get("title") or _title_from(content, "Untitled"),
+                'content': content,
+            }
+
+
+def _iter_files(root, suffixes):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in sorted(filenames):
+            if name.lower().endswith(suffixes):
+                yield os.path.join(dirpath, name)
+
+
+def _iter_file_notes(root, suffixes, category):
+    for path in _iter_files(root, suffixes):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            content = f.read()
+        stem = os.path.splitext(os.path.basename(path))[0]
+        yield {'category': category, 'title': _title_from(content, stem), 'content': content}
+
+
+def iter_markdown_dir(root, category=DEFAULT_CATEGORY):
+    """One note per .md/.markdown file under root; the title is the first heading or line."""
+    return _iter_file_notes(root, MARKDOWN_SUFFIXES, category)
+
+
+def iter_text_dir(root, category=DEFAULT_CATEGORY):
+    """One note per .txt file under root; the title is the first line."""
+    return _iter_file_notes(root, TEXT_SUFFIXES, category)
+
+
+def iter_source(path, category=DEFAULT_CATEGORY):
+    """Pick the reader for a path: a .jsonl file, or a folder of Markdown and text files."""
+    if os.path.isdir(path):
+        return _iter_file_notes(path, MARKDOWN_SUFFIXES + TEXT_SUFFIXES, category)
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        return iter_jsonl(path, category)
+    raise ValueError(f"Don't know how to import {path!r} (expected a .jsonl file or a folder)")
+
+
+def batched(records, size=IMPORT_BATCH_SIZE):
+    """Yield lists of up to `size` records."""
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m models.importer", description="Import notes in bulk.")
+    parser.add_argument("path", help=".jsonl file, or a folder of .md/.txt files")
+    parser.add_argument("--category", default=DEFAULT_CATEGORY,
+                        help="category for notes that don't name one (default: %(default)s)")
+    parser.add_argument("--db", default="data/notes.db", help="database file (default: %(default)s)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        records = iter_source(args.path, args.category)
+    except ValueError as e:
+        parser.error(str(e))
+
+    from models.model import NoteModel
+
+    def progress(count):
+        print(f"\rimported {count} notes", end="", file=sys.stderr, flush=True)
+
+    model = NoteModel(args.db, profile="bulk")
+    try:
+        count = model.import_notes(records, batch_size=args.batch_size, progress=progress)
+    except (OSError, ValueError) as e:
+        print(f"\nimport failed, nothing was imported: {e}", file=sys.stderr)
+        return 1
+    finally:
+        model.close()
+    print(f"\rimported {count} notes", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
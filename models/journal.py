@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Appends and fsyncs happen here, never on the GUI thread. One worker keeps
+# every journal's records in the order they were made.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="journal")
+
+JOURNAL_SUFFIX = ".journal"
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _common_prefix(a, b):
+    """Length of the common prefix, found by bisecting with C-speed slice compares."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a, b, limit):
+    """Length of the common suffix, not reaching into the first `limit` characters."""
+    lo, hi = 0, min(len(a), len(b)) - limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def diff_edit(old, new):
+    """
+    Describe the change from old to new as one replacement (at, removed, inserted):
+    new == old[:at] + inserted + old[at + removed:]. Typing between two autosaves
+    is almost always one contiguous region, so this stays small.
+    """
+    at = _common_prefix(old, new)
+    tail = _common_suffix(old, new, at)
+    return at, len(old) - at - tail, new[at:len(new) - tail]
+
+
+def apply_edit(text, at, removed, inserted):
+    return text[:at] + inserted + text[at + removed:]
+
+
+class AutosaveJournal:
+    """
+    Append-only record of one editor session's unsaved changes.
+
+    The first line is a header naming the note and the digest of the content
+    the editor started from; each further line is one edit against the text
+    after the previous line. Nothing touches the disk until the first record.
+    """
+
+    def __init__(self, path, note_id, category, base):
+        self.path = path
+        self.note_id = note_id
+        self.category = category
+        self._text = base
+        self._base_digest = _digest(base)
+        self._file = None  # only used on the journal thread
+
+    def record(self, text):
+        """Journal the editor's current text; cheap, the write happens in the background."""
+        if text == self._text:
+            return
+        at, removed, inserted = diff_edit(self._text, text)
+        self._text = text
+        line = json.dumps({'at': at, 'del': removed, 'ins': inserted}, ensure_ascii=False)
+        _executor.submit(self._append, line)
+
+    def _append(self, line):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+            header = {'note_id': self.note_id, 'category': self.category, 'base': self._base_digest}
+            self._file.write(json.dumps(header, ensure_ascii=False) + "\n")
+        self._file.write(line + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def discard(self):
+        """Drop the journal, e.g. once its content has been saved into the note."""
+        _executor.submit(self._remove)
+
+    def _remove(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class JournalStore:
+    """Directory of autosave journals; one file per open editor."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def open(self, note_id, category, base):
+        """Start a journal for an editor on note_id (None for a note not created yet)."""
+        name = f"{note_id or 'new-' + str(uuid.uuid4())}{JOURNAL_SUFFIX}"
+        return AutosaveJournal(os.path.join(self.root, name), note_id, category, base)
+
+    @staticmethod
+    def _replay(path, load_base):
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        if len(lines) < 2:
+            return None
+        header = json.loads(lines[0])
+        base = load_base(header['note_id']) if header['note_id'] else ""
+        if base is None or _digest(base) != header['base']:
+            return None  # the note was deleted or changed since; the edits don't apply
+        text = base
+        for line in lines[1:]:
+            try:
+                edit = json.loads(line)
+            except ValueError:
+                break  # torn final record from the crash
+            text = apply_edit(text, edit['at'], edit['del'], edit['ins'])
+        return {'note_id': header['note_id'], 'category': header['category'],
+                'content': text, 'path': path}
+
+    def recover(self, load_base):
+        """
+        Rebuild the unsaved text of every journal left behind by a crash.
+        load_base(note_id) returns the note's stored content (None if gone).
+        Journals that can no longer be applied are removed.
+        """
+        if not os.path.isdir(self.root):
+            return []
+        recovered = []
+        for name in sorted(os.listdir(self.root)):
+            if not name.endswith(JOURNAL_SUFFIX):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                entry = self._replay(path, load_base)
+            except (OSError, ValueError, KeyError):
+                entry = None
+            if entry is None:
+                self.remove(path)
+            else:
+                recovered.append(entry)
+        return recovered
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
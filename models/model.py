@@ -1,21 +1,117 @@
-import sqlite3
 import uuid
 import os
+import re
+import time
+
+from models.attachments import AttachmentStore, GC_GRACE_SECONDS, find_attachments
+from models.cache import ContentCache
+from models.compression import CODEC_PLAIN, COMPRESS_MIN_BYTES, encode_content, encode_note, decode_content
+from models.database import get_database, release_database
+from models.importer import IMPORT_BATCH_SIZE, batched
+from models.journal import JournalStore
+from models.snippet import fold, make_snippet
+from models.revisions import CHECKPOINT_INTERVAL, MAX_REVISIONS_PER_NOTE, line_diff, apply_line_diff
+from models.write_behind import WriteBehindQueue, PendingWrite, INSERT, UPDATE, CONTENT, DELETE
+
+# bm25 column weights used to rank search() results; stored as the index's
+# default rank by _configure_search_rank (a new schema step if they change).
+SEARCH_TITLE_WEIGHT = 10.0
+SEARCH_CONTENT_WEIGHT = 1.0
+# search() ranks at most this many matches, the most recently added ones;
+# bm25 over every match of a common word costs ~20 ms at 10k notes
+SEARCH_RANK_CANDIDATES = 1000
+_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# list_notes() orders: name -> (sort column, direction). Ties are broken by id in the same direction.
+LIST_ORDERS = {
+    "title": ("title", "ASC"),
+    "updated": ("updated_at", "DESC"),
+    "created": ("created_at", "DESC"),
+}
+LIST_PAGE_SIZE = 200
 
 class NoteModel:
-    def __init__(self, db_path="data/notes.db"):
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self.conn = sqlite3.connect(db_path)
+    def __init__(self, db_path="data/notes.db", profile="default", cache_bytes=16 * 1024 * 1024,
+                 write_behind_interval=None):
+        # All models for the same file share one Database (one connection per thread)
+        self.db = get_database(db_path, profile)
+        self._closed = False
+        # Recently viewed notes, shared by every view/controller using this model
+        self.content_cache = ContentCache(cache_bytes)
+        # Embedded images live next to the database, named by content hash
+        self.attachments = AttachmentStore(os.path.dirname(db_path) or ".")
+        # Autosave journals of open editors, replayed after a crash
+        self.journals = JournalStore(os.path.join(os.path.dirname(db_path) or ".", "journal"))
         self._create_tables()
+        # Optional group commit: writes are queued, coalesced per note and
+        # committed together every write_behind_interval seconds
+        self.write_queue = None
+        if write_behind_interval is not None:
+            self.write_queue = WriteBehindQueue(self._apply_writes, write_behind_interval)
+
+    @property
+    def conn(self):
+        """The calling thread's connection; reads run on it without a transaction."""
+        return self.db.connection
+
+    def close(self):
+        """Flush queued writes and release the shared Database (closed once no model uses it)."""
+        if self.write_queue is not None:
+            self.write_queue.close()
+            self.write_queue = None
+        if not self._closed:
+            self._closed = True
+            release_database(self.db)
+
+    # Schema steps in the order they were introduced. PRAGMA user_version records
+    # how many have been applied, so opening a database only runs the new ones.
+    # Steps up to _create_revisions predate versioning and are safe to rerun on a
+    # database that already has them (user_version 0). Only ever append.
+    MIGRATIONS = (
+        "_create_base_tables",
+        "_migrate_compression",
+        "_create_search_index",
+        "_create_stats_counters",
+        "_create_attachment_refs",
+        "_create_sticky_geometry",
+        "_create_revisions",
+        "_add_timestamps",
+        "_create_revision_attachments",
+        "_configure_search_rank",
+        "_add_text_bytes",
+        "_make_search_index_contentless",
+        "_compress_revisions",
+        "_track_search_index",
+    )
+
+    @property
+    def schema_version(self):
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
 
     def _create_tables(self):
-        with self.conn:
+        # Queries (and the app's TEMP triggers) read bodies through note_text(content, codec)
+        self.db.create_function("note_text", 2, decode_content)
+        version = self.schema_version
+        if version > len(self.MIGRATIONS):
+            raise RuntimeError(f"{self.db.db_path} has schema version {version}, newer than this "
+                               f"version of the app supports ({len(self.MIGRATIONS)})")
+        for target in range(version + 1, len(self.MIGRATIONS) + 1):
+            # Each step commits together with its version number
+            with self.db.transaction():
+                getattr(self, self.MIGRATIONS[target - 1])()
+                self.conn.execute(f"PRAGMA user_version = {target}")
+        self.db.add_connection_setup("notes_fts", self._create_search_triggers)
+        self._check_search_index()
+
+    def _create_base_tables(self):
+        with self.db.transaction():
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS notes (
                     id TEXT PRIMARY KEY,
                     category TEXT NOT NULL,
                     title TEXT NOT NULL,
-                    content TEXT NOT NULL
+                    content TEXT NOT NULL,
+                    codec INTEGER NOT NULL DEFAULT 0
                 )
             """)
             self.conn.execute("""
@@ -25,64 +121,939 @@ class NoteModel:
                     completed INTEGER NOT NULL DEFAULT 0
                 )
             """)
+            # Covering index for note list queries: (category, title, id) is enough to
+            # answer get_note_summaries() without touching the table rows or bodies.
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notes_category_title
+                ON notes (category, title, id)
+            """)
 
-    def get_notes(self, category):
-        with self.conn:
-            cursor = self.conn.execute("SELECT id, title, content FROM notes WHERE category = ?", (category,))
-            rows = cursor.fetchall()
-            return [{'id': row[0], 'title': row[1], 'content': row[2]} for row in rows]
+    def _migrate_compression(self):
+        """
+        One-time upgrade of databases from before compression: add notes.codec and
+        category_stats.stored_bytes, compress existing large bodies, and replace
+        the triggers that read notes.content directly.
+        """
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(notes)")}
+        if "codec" in columns:
+            return
 
-    def get_note_by_id(self, category, note_id):
-        with self.conn:
-            cursor = self.conn.execute(
-                "SELECT id, title, content FROM notes WHERE category = ? AND id = ?",
-                (category, note_id)
+        with self.db.transaction():
+            self.conn.execute("ALTER TABLE notes ADD COLUMN codec INTEGER NOT NULL DEFAULT 0")
+            # Recreated by _create_search_index/_create_stats_counters. With them gone,
+            # compressing rows below doesn't churn the search index or the counters.
+            for trigger in ("notes_fts_insert", "notes_fts_update",
+                            "category_stats_insert", "category_stats_delete", "category_stats_update"):
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+            rows = self.conn.execute(
+                "SELECT id, content FROM notes WHERE LENGTH(CAST(content AS BLOB)) >= ?",
+                (COMPRESS_MIN_BYTES,)
+            ).fetchall()
+            for note_id, content in rows:
+                value, codec = encode_content(content)
+                if codec != CODEC_PLAIN:
+                    self.conn.execute(
+                        "UPDATE notes SET content = ?, codec = ? WHERE id = ?",
+                        (value, codec, note_id)
+                    )
+
+            stats_exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'category_stats'"
+            ).fetchone()
+            if stats_exists:
+                # Counters are recomputed by _add_text_bytes
+                self.conn.execute("ALTER TABLE category_stats ADD COLUMN stored_bytes INTEGER NOT NULL DEFAULT 0")
+
+    def _create_search_index(self):
+        """
+        Create the first FTS5 index over notes and the triggers that kept it current.
+        Replaced by _make_search_index_contentless, which also fills it.
+        """
+        with self.db.transaction():
+            # Standalone FTS5 table keyed by the notes rowid. note_id and category are
+            # stored unindexed so search results never need a join back to notes.
+            self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+                    note_id UNINDEXED,
+                    category UNINDEXED,
+                    title,
+                    content,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
+                    INSERT INTO notes_fts (rowid, note_id, category, title, content)
+                    VALUES (new.rowid, new.id, new.category, new.title, note_text(new.content, new.codec));
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+                    DELETE FROM notes_fts WHERE rowid = old.rowid;
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS notes_fts_update
+                AFTER UPDATE OF category, title, content, codec ON notes BEGIN
+                    DELETE FROM notes_fts WHERE rowid = old.rowid;
+                    INSERT INTO notes_fts (rowid, note_id, category, title, content)
+                    VALUES (new.rowid, new.id, new.category, new.title, note_text(new.content, new.codec));
+                END
+            """)
+
+    def _create_stats_counters(self):
+        """
+        Create the dashboard counter tables and the triggers that keep them current.
+        The note triggers are replaced, and the counters filled, by _add_text_bytes.
+        """
+        with self.db.transaction():
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS category_stats (
+                    category TEXT PRIMARY KEY,
+                    note_count INTEGER NOT NULL DEFAULT 0,
+                    total_bytes INTEGER NOT NULL DEFAULT 0,
+                    stored_bytes INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    completed INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS category_stats_insert AFTER INSERT ON notes BEGIN
+                    INSERT INTO category_stats (category, note_count, total_bytes, stored_bytes)
+                    VALUES (new.category, 1, LENGTH(CAST(note_text(new.content, new.codec) AS BLOB)),
+                            LENGTH(CAST(new.content AS BLOB)))
+                    ON CONFLICT (category) DO UPDATE SET
+                        note_count = note_count + 1,
+                        total_bytes = total_bytes + excluded.total_bytes,
+                        stored_bytes = stored_bytes + excluded.stored_bytes;
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS category_stats_delete AFTER DELETE ON notes BEGIN
+                    UPDATE category_stats SET
+                        note_count = note_count - 1,
+                        total_bytes = total_bytes - LENGTH(CAST(note_text(old.content, old.codec) AS BLOB)),
+                        stored_bytes = stored_bytes - LENGTH(CAST(old.content AS BLOB))
+                    WHERE category = old.category;
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS category_stats_update
+                AFTER UPDATE OF category, content, codec ON notes BEGIN
+                    UPDATE category_stats SET
+                        note_count = note_count - 1,
+                        total_bytes = total_bytes - LENGTH(CAST(note_text(old.content, old.codec) AS BLOB)),
+                        stored_bytes = stored_bytes - LENGTH(CAST(old.content AS BLOB))
+                    WHERE category = old.category;
+                    INSERT INTO category_stats (category, note_count, total_bytes, stored_bytes)
+                    VALUES (new.category, 1, LENGTH(CAST(note_text(new.content, new.codec) AS BLOB)),
+                            LENGTH(CAST(new.content AS BLOB)))
+                    ON CONFLICT (category) DO UPDATE SET
+                        note_count = note_count + 1,
+                        total_bytes = total_bytes + excluded.total_bytes,
+                        stored_bytes = stored_bytes + excluded.stored_bytes;
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS task_stats_insert
+                AFTER INSERT ON tasks WHEN new.completed = 1 BEGIN
+                    UPDATE task_stats SET completed = completed + 1;
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS task_stats_delete
+                AFTER DELETE ON tasks WHEN old.completed = 1 BEGIN
+                    UPDATE task_stats SET completed = completed - 1;
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS task_stats_update
+                AFTER UPDATE OF completed ON tasks WHEN (old.completed = 1) != (new.completed = 1) BEGIN
+                    UPDATE task_stats SET completed = completed + (CASE WHEN new.completed = 1 THEN 1 ELSE -1 END);
+                END
+            """)
+
+    def rebuild_stats_counters(self):
+        """Recompute the dashboard counters from scratch."""
+        with self.db.transaction():
+            self.conn.execute("DELETE FROM category_stats")
+            self.conn.execute("""
+                INSERT INTO category_stats (category, note_count, total_bytes, stored_bytes)
+                SELECT category, COUNT(*),
+                       COALESCE(SUM(CASE WHEN codec = 0 THEN LENGTH(CAST(content AS BLOB)) ELSE text_bytes END), 0),
+                       COALESCE(SUM(LENGTH(CAST(content AS BLOB))), 0)
+                FROM notes GROUP BY category
+            """)
+            self.conn.execute("""
+                INSERT OR REPLACE INTO task_stats (id, completed)
+                SELECT 1, COUNT(*) FROM tasks WHERE completed = 1
+            """)
+
+    def _create_attachment_refs(self):
+        """Create the table linking notes to the attachment files they embed."""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'note_attachments'"
+        ).fetchone()
+
+        with self.db.transaction():
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS note_attachments (
+                    note_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    PRIMARY KEY (note_id, name)
+                ) WITHOUT ROWID
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_note_attachments_name
+                ON note_attachments (name)
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS note_attachments_delete AFTER DELETE ON notes BEGIN
+                    DELETE FROM note_attachments WHERE note_id = old.id;
+                END
+            """)
+
+        if not exists:
+            # Backfill references for notes written before the table existed
+            with self.db.transaction():
+                cursor = self.conn.execute(
+                    "SELECT id, note_text(content, codec) FROM notes WHERE instr(note_text(content, codec), '[image:') > 0"
+                )
+                for note_id, content in cursor.fetchall():
+                    self._sync_attachments(note_id, content)
+
+    def _create_sticky_geometry(self):
+        """Create the table remembering where each sticky note window was on screen."""
+        with self.db.transaction():
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sticky_geometry (
+                    note_id TEXT PRIMARY KEY,
+                    geometry BLOB NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS sticky_geometry_delete AFTER DELETE ON notes BEGIN
+                    DELETE FROM sticky_geometry WHERE note_id = old.id;
+                END
+            """)
+
+    def _create_revisions(self):
+        """Create the table of earlier versions of each note (full checkpoints + line deltas)."""
+        with self.db.transaction():
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS note_revisions (
+                    note_id TEXT NOT NULL,
+                    rev INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    full INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (note_id, rev)
+                ) WITHOUT ROWID
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS note_revisions_delete AFTER DELETE ON notes BEGIN
+                    DELETE FROM note_revisions WHERE note_id = old.id;
+                END
+            """)
+
+    def _add_timestamps(self):
+        """
+        Add notes.created_at/updated_at (epoch seconds) and the indexes behind the
+        list_notes() orders. Existing notes take their times from their revision
+        history where they have one, otherwise the time of the upgrade.
+        """
+        self.conn.execute("ALTER TABLE notes ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+        self.conn.execute("ALTER TABLE notes ADD COLUMN updated_at REAL NOT NULL DEFAULT 0")
+        # Older databases reindexed a note for any UPDATE; the backfill below would
+        # rewrite the whole search index. Now only the indexed columns trigger it.
+        self.conn.execute("DROP TRIGGER IF EXISTS notes_fts_update")
+        self._create_search_index()
+
+        now = time.time()
+        self.conn.execute("""
+            UPDATE notes SET
+                created_at = COALESCE((SELECT MIN(created_at) FROM note_revisions r WHERE r.note_id = notes.id), ?),
+                updated_at = COALESCE((SELECT MAX(created_at) FROM note_revisions r WHERE r.note_id = notes.id), ?)
+        """, (now, now))
+        # Covering indexes (like idx_notes_category_title) for the keyset-paged orders
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notes_category_updated
+            ON notes (category, updated_at DESC, id DESC, title)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notes_category_created
+            ON notes (category, created_at DESC, id DESC, title)
+        """)
+
+    def _create_revision_attachments(self):
+        """
+        Create the table of attachments referenced by kept revisions, so garbage
+        collection keeps the images an older version would bring back on restore.
+        """
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS revision_attachments (
+                note_id TEXT NOT NULL,
+                rev INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                PRIMARY KEY (note_id, rev, name)
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS revision_attachments_delete AFTER DELETE ON notes BEGIN
+                DELETE FROM revision_attachments WHERE note_id = old.id;
+            END
+        """)
+        # Backfill: a revision can only show an image if some kept row of its note
+        # (a checkpoint or an inserting delta) contains the tag
+        note_ids = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT note_id FROM note_revisions WHERE instr(data, '[image:') > 0"
+        )]
+        for note_id in note_ids:
+            content = None
+            for rev, full, data in self.conn.execute(
+                "SELECT rev, full, data FROM note_revisions WHERE note_id = ? ORDER BY rev", (note_id,)
+            ).fetchall():
+                content = data if full else apply_line_diff(content, data)
+                self._add_revision_attachments(note_id, rev, content)
+
+    def _configure_search_rank(self):
+        """
+        Make the weighted bm25 the index's rank, so search() can ORDER BY rank.
+        Ranking by an inline bm25() call made FTS5 compute snippets for every
+        match before the LIMIT applied.
+        """
+        self.conn.execute(
+            "INSERT INTO notes_fts (notes_fts, rank) VALUES ('rank', ?)",
+            (f"bm25(0.0, 0.0, {SEARCH_TITLE_WEIGHT}, {SEARCH_CONTENT_WEIGHT})",)
+        )
+
+    def _add_text_bytes(self):
+        """
+        Add notes.text_bytes (the typed size of compressed bodies) and make the
+        counter triggers pure SQL. The old ones called the app's note_text(), so
+        any write from another SQLite tool failed with "no such function".
+        """
+        self.conn.execute("ALTER TABLE notes ADD COLUMN text_bytes INTEGER")
+        self.conn.execute(
+            "UPDATE notes SET text_bytes = LENGTH(CAST(note_text(content, codec) AS BLOB)) WHERE codec != ?",
+            (CODEC_PLAIN,)
+        )
+        for trigger in ("category_stats_insert", "category_stats_delete", "category_stats_update"):
+            self.conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        # Typed size: read off plain bodies, stored for compressed ones
+        new_bytes = "CASE WHEN new.codec = 0 THEN LENGTH(CAST(new.content AS BLOB)) ELSE new.text_bytes END"
+        old_bytes = "CASE WHEN old.codec = 0 THEN LENGTH(CAST(old.content AS BLOB)) ELSE old.text_bytes END"
+        self.conn.execute(f"""
+            CREATE TRIGGER category_stats_insert AFTER INSERT ON notes BEGIN
+                INSERT INTO category_stats (category, note_count, total_bytes, stored_bytes)
+                VALUES (new.category, 1, {new_bytes}, LENGTH(CAST(new.content AS BLOB)))
+                ON CONFLICT (category) DO UPDATE SET
+                    note_count = note_count + 1,
+                    total_bytes = total_bytes + excluded.total_bytes,
+                    stored_bytes = stored_bytes + excluded.stored_bytes;
+            END
+        """)
+        self.conn.execute(f"""
+            CREATE TRIGGER category_stats_delete AFTER DELETE ON notes BEGIN
+                UPDATE category_stats SET
+                    note_count = note_count - 1,
+                    total_bytes = total_bytes - ({old_bytes}),
+                    stored_bytes = stored_bytes - LENGTH(CAST(old.content AS BLOB))
+                WHERE category = old.category;
+            END
+        """)
+        self.conn.execute(f"""
+            CREATE TRIGGER category_stats_update
+            AFTER UPDATE OF category, content, codec, text_bytes ON notes BEGIN
+                UPDATE category_stats SET
+                    note_count = note_count - 1,
+                    total_bytes = total_bytes - ({old_bytes}),
+                    stored_bytes = stored_bytes - LENGTH(CAST(old.content AS BLOB))
+                WHERE category = old.category;
+                INSERT INTO category_stats (category, note_count, total_bytes, stored_bytes)
+                VALUES (new.category, 1, {new_bytes}, LENGTH(CAST(new.content AS BLOB)))
+                ON CONFLICT (category) DO UPDATE SET
+                    note_count = note_count + 1,
+                    total_bytes = total_bytes + excluded.total_bytes,
+                    stored_bytes = stored_bytes + excluded.stored_bytes;
+            END
+        """)
+        self.rebuild_stats_counters()
+
+    def _make_search_index_contentless(self):
+        """
+        Replace the search index with a contentless one. The old index kept its
+        own plain-text copy of every body, about twice the size of the compressed
+        notes table. Search reads titles and snippets from notes instead.
+        """
+        for trigger in ("notes_fts_insert", "notes_fts_delete", "notes_fts_update"):
+            self.conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        self.conn.execute("DROP TABLE IF EXISTS notes_fts")
+        # Keyed by the notes rowid; only the tokens are stored
+        self.conn.execute("""
+            CREATE VIRTUAL TABLE notes_fts USING fts5(
+                title,
+                content,
+                content = '',
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+        """)
+        self.conn.execute(
+            "INSERT INTO notes_fts (notes_fts, rank) VALUES ('rank', ?)",
+            (f"bm25({SEARCH_TITLE_WEIGHT}, {SEARCH_CONTENT_WEIGHT})",)
+        )
+        # Filled in by _track_search_index, which rebuilds the index anyway
+
+    @staticmethod
+    def _create_search_triggers(conn):
+        """
+        Keep the search index current for this connection's writes.
+
+        These are TEMP triggers, created on each of the app's connections, because
+        indexing a compressed body needs the app's note_text(). Writes made with
+        other SQLite tools therefore still work but aren't indexed. They are
+        counted instead (see _track_search_index) and _check_search_index
+        rebuilds the index on the next start.
+        """
+        conn.execute("""
+            CREATE TEMP TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON main.notes BEGIN
+                INSERT INTO notes_fts (rowid, title, content)
+                VALUES (new.rowid, new.title, note_text(new.content, new.codec));
+                UPDATE search_index_state SET unindexed = unindexed - 1;
+            END
+        """)
+        # A contentless index is told the exact values it indexed, to remove them
+        conn.execute("""
+            CREATE TEMP TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON main.notes BEGIN
+                INSERT INTO notes_fts (notes_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, note_text(old.content, old.codec));
+                UPDATE search_index_state SET unindexed = unindexed - 1;
+            END
+        """)
+        conn.execute("""
+            CREATE TEMP TRIGGER IF NOT EXISTS notes_fts_update
+            AFTER UPDATE OF title, content, codec ON main.notes BEGIN
+                INSERT INTO notes_fts (notes_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, note_text(old.content, old.codec));
+                INSERT INTO notes_fts (rowid, title, content)
+                VALUES (new.rowid, new.title, note_text(new.content, new.codec));
+                UPDATE search_index_state SET unindexed = unindexed - 1;
+            END
+        """)
+
+    def _check_search_index(self):
+        """Rebuild the search index if notes were written outside the app."""
+        unindexed = self.conn.execute("SELECT unindexed FROM search_index_state").fetchone()[0]
+        if unindexed:
+            self.rebuild_search_index()
+
+    def _track_search_index(self):
+        """
+        Count note writes that the search index hasn't seen. These triggers are
+        stored in the database, so they also fire for other SQLite tools; the
+        app's TEMP search triggers take each indexed write back off the count.
+        """
+        self.conn.execute("CREATE TABLE IF NOT EXISTS search_index_state (unindexed INTEGER NOT NULL)")
+        self.conn.execute("INSERT INTO search_index_state (unindexed) VALUES (0)")
+        for trigger, event in (("insert", "INSERT"), ("delete", "DELETE"),
+                               ("update", "UPDATE OF title, content, codec")):
+            self.conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS search_index_unindexed_{trigger} AFTER {event} ON notes BEGIN
+                    UPDATE search_index_state SET unindexed = unindexed + 1;
+                END
+            """)
+        # Edits made elsewhere before this step can't be told apart, so start afresh
+        self.rebuild_search_index()
+
+    def _compress_revisions(self):
+        """Add note_revisions.codec and compress large checkpoints (and deltas) like note bodies."""
+        self.conn.execute("ALTER TABLE note_revisions ADD COLUMN codec INTEGER NOT NULL DEFAULT 0")
+        rows = self.conn.execute(
+            "SELECT note_id, rev, data FROM note_revisions WHERE LENGTH(CAST(data AS BLOB)) >= ?",
+            (COMPRESS_MIN_BYTES,)
+        ).fetchall()
+        for note_id, rev, data in rows:
+            value, codec = encode_content(data)
+            if codec != CODEC_PLAIN:
+                self.conn.execute(
+                    "UPDATE note_revisions SET data = ?, codec = ? WHERE note_id = ? AND rev = ?",
+                    (value, codec, note_id, rev)
+                )
+
+    def _add_revision_attachments(self, note_id, rev, content):
+        names = find_attachments(content)
+        if names:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO revision_attachments (note_id, rev, name) VALUES (?, ?, ?)",
+                [(note_id, rev, name) for name in names]
             )
-            row = cursor.fetchone()
-            if row:
-                return {'id': row[0], 'title': row[1], 'content': row[2]}
+
+    def _sync_attachments(self, note_id, content):
+        """Replace a note's attachment references; call inside a write transaction."""
+        self.conn.execute("DELETE FROM note_attachments WHERE note_id = ?", (note_id,))
+        names = find_attachments(content)
+        if names:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO note_attachments (note_id, name) VALUES (?, ?)",
+                [(note_id, name) for name in names]
+            )
+
+    def collect_attachment_garbage(self, grace_seconds=GC_GRACE_SECONDS):
+        """Delete attachment files no note references any more; returns the removed names."""
+        self._read_barrier()
+        # Images only an older revision still shows are kept for restore_revision()
+        cursor = self.conn.execute("""
+            SELECT name FROM note_attachments
+            UNION
+            SELECT name FROM revision_attachments
+        """)
+        referenced = {row[0] for row in cursor.fetchall()}
+        return self.attachments.collect_garbage(referenced, grace_seconds)
+
+    def rebuild_search_index(self):
+        """Repopulate the search index from the notes table (e.g. after editing notes elsewhere)."""
+        with self.db.transaction():
+            self.conn.execute("INSERT INTO notes_fts (notes_fts) VALUES ('delete-all')")
+            self.conn.execute("""
+                INSERT INTO notes_fts (rowid, title, content)
+                SELECT rowid, title, note_text(content, codec) FROM notes
+            """)
+            self.conn.execute("UPDATE search_index_state SET unindexed = 0")
+
+    def get_notes(self, category):
+        """Every note of a category with its content, most recently updated first."""
+        self._read_barrier()
+        cursor = self.conn.execute(
+            "SELECT id, title, content, codec FROM notes WHERE category = ? ORDER BY updated_at DESC, id DESC",
+            (category,)
+        )
+        rows = cursor.fetchall()
+        return [{'id': row[0], 'title': row[1], 'content': decode_content(row[2], row[3])} for row in rows]
+
+    def get_note_summaries(self, category, after=None, limit=None):
+        """
+        Return only 'id' and 'title' for the notes in a category, ordered by title.
+        For paging, pass limit and, as after, the (title, id) of the last row already loaded.
+        """
+        return [{'id': note['id'], 'title': note['title']}
+                for note in self.list_notes(category, "title", after=after, limit=limit)]
+
+    def list_notes(self, category, order="title", after=None, limit=LIST_PAGE_SIZE):
+        """
+        One page of a category's notes: [{'id', 'title'}], plus the order's sort
+        column ('updated_at' or 'created_at') for the time orders.
+
+        order is a LIST_ORDERS key: "title" (A-Z), "updated" or "created" (newest
+        first). Pages are keyset-paged on a covering index, so every page costs the
+        same however deep it is: pass as after the cursor of the last row already
+        loaded, list_cursor(order, row). limit=None returns every remaining row.
+        """
+        column, direction = LIST_ORDERS[order]
+        # Only columns of the order's index, so the query never reads table rows
+        columns = ["id", "title"] + ([column] if column != "title" else [])
+        self._read_barrier()
+        sql = f"SELECT {', '.join(columns)} FROM notes WHERE category = ?"
+        params = [category]
+        if after is not None:
+            sql += f" AND ({column}, id) {'>' if direction == 'ASC' else '<'} (?, ?)"
+            params += list(after)
+        sql += f" ORDER BY {column} {direction}, id {direction} LIMIT ?"
+        params.append(limit if limit is not None else -1)
+        cursor = self.conn.execute(sql, params)
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def list_cursor(order, note):
+        """The after= value that continues a list_notes() listing past this row."""
+        return note[LIST_ORDERS[order][0]], note['id']
+
+    def _load_note(self, note_id):
+        """Fetch a full note row through the content cache."""
+        note = self.content_cache.get(note_id)
+        if note is not None:
+            return note
+
+        self._read_barrier()
+        generation = self.content_cache.generation
+        # Sized in UTF-8 bytes for the cache; text_bytes is only stored for compressed bodies
+        cursor = self.conn.execute("""
+            SELECT id, category, title, content, codec,
+                   LENGTH(CAST(title AS BLOB)) + COALESCE(text_bytes, LENGTH(CAST(content AS BLOB)))
+            FROM notes WHERE id = ?
+        """, (note_id,))
+        row = cursor.fetchone()
+        if not row:
             return None
+        note = {'id': row[0], 'category': row[1], 'title': row[2], 'content': decode_content(row[3], row[4])}
+        self.content_cache.put(note_id, note, generation, size=row[5])
+        return note
+
+    def get_note_by_id(self, category, note_id):
+        note = self._load_note(note_id)
+        if note and note['category'] == category:
+            return {'id': note['id'], 'title': note['title'], 'content': note['content']}
+        return None
+
+    def cache_stats(self):
+        """Hit/miss counters of the note content cache."""
+        return self.content_cache.stats()
 
     def add_note(self, category, title, content):
         note_id = str(uuid.uuid4())
-        with self.conn:
-            self.conn.execute(
-                "INSERT INTO notes (id, category, title, content) VALUES (?, ?, ?, ?)",
-                (note_id, category, title, content)
-            )
+        self._write(note_id, PendingWrite(INSERT, category, title, content))
         return note_id
 
     def edit_note(self, category, note_id, title, content):
-        with self.conn:
-            self.conn.execute(
-                "UPDATE notes SET title = ?, content = ? WHERE id = ? AND category = ?",
-                (title, content, note_id, category)
-            )
+        self._write(note_id, PendingWrite(UPDATE, category, title, content))
 
     def delete_note(self, category, note_id):
-        with self.conn:
+        self._write(note_id, PendingWrite(DELETE, category))
+
+    def import_notes(self, records, batch_size=IMPORT_BATCH_SIZE, progress=None):
+        """
+        Insert notes ({'category', 'title', 'content'} dicts, any iterable) in bulk.
+
+        Records are consumed batch by batch and each batch is inserted with
+        executemany in its own transaction, so other writers (the write-behind
+        flusher, edits) wait for one batch at most rather than the whole import.
+        If a batch fails, or progress(count) (called after each batch) raises
+        ImportCancelled, the notes already committed are deleted again, so an
+        import is still all-or-nothing. History starts at each note's first
+        edit, as for notes written before revisions existed.
+        Returns the number of notes imported.
+        """
+        self._read_barrier()
+        imported = []
+        now = time.time()
+        try:
+            for batch in batched(records, batch_size):
+                rows = []
+                refs = []
+                for record in batch:
+                    note_id = str(uuid.uuid4())
+                    content = record['content']
+                    rows.append((note_id, record['category'], record['title'], *encode_note(content), now, now))
+                    refs.extend((note_id, name) for name in find_attachments(content))
+                with self.db.transaction():
+                    self.conn.executemany(
+                        "INSERT INTO notes (id, category, title, content, codec, text_bytes, created_at, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+                    if refs:
+                        self.conn.executemany(
+                            "INSERT OR IGNORE INTO note_attachments (note_id, name) VALUES (?, ?)",
+                            refs
+                        )
+                imported.extend(row[0] for row in rows)
+                if progress is not None:
+                    progress(len(imported))
+        except BaseException:
+            self._discard_imported(imported, batch_size)
+            raise
+        return len(imported)
+
+    def _discard_imported(self, note_ids, batch_size):
+        """Delete the notes of an abandoned import, a batch per transaction."""
+        for batch in batched(note_ids, batch_size):
+            with self.db.transaction():
+                self.conn.executemany("DELETE FROM notes WHERE id = ?", [(note_id,) for note_id in batch])
+
+    # Write path: every mutation of a note goes through _write, either straight
+    # into its own transaction or, with write-behind enabled, into the queue.
+    def _write(self, note_id, write):
+        if self.write_queue is not None:
+            self.write_queue.enqueue(note_id, write)
+        else:
+            with self.db.transaction():
+                self._apply_write(note_id, write)
+        self.content_cache.invalidate(note_id)
+
+    def _apply_writes(self, writes):
+        """Commit a batch of queued (note_id, write) pairs in one transaction."""
+        with self.db.transaction():
+            for note_id, write in writes:
+                self._apply_write(note_id, write)
+        for note_id, _ in writes:
+            self.content_cache.invalidate(note_id)
+
+    def _apply_write(self, note_id, write):
+        """Run one write; call inside a write transaction."""
+        now = time.time()
+        if write.kind == INSERT:
+            self.conn.execute(
+                "INSERT INTO notes (id, category, title, content, codec, text_bytes, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (note_id, write.category, write.title, *encode_note(write.content), now, now)
+            )
+            self._sync_attachments(note_id, write.content)
+            self._record_revision(note_id, None, write.content)
+        elif write.kind == UPDATE:
+            old_content = self._stored_content(note_id)
+            cursor = self.conn.execute(
+                "UPDATE notes SET title = ?, content = ?, codec = ?, text_bytes = ?, updated_at = ? "
+                "WHERE id = ? AND category = ?",
+                (write.title, *encode_note(write.content), now, note_id, write.category)
+            )
+            if cursor.rowcount:
+                self._sync_attachments(note_id, write.content)
+                self._record_revision(note_id, old_content, write.content)
+        elif write.kind == CONTENT:
+            old_content = self._stored_content(note_id)
+            cursor = self.conn.execute(
+                "UPDATE notes SET content = ?, codec = ?, text_bytes = ?, updated_at = ? WHERE id = ?",
+                (*encode_note(write.content), now, note_id)
+            )
+            if cursor.rowcount:
+                self._sync_attachments(note_id, write.content)
+                self._record_revision(note_id, old_content, write.content)
+        elif write.kind == DELETE:
             self.conn.execute(
                 "DELETE FROM notes WHERE id = ? AND category = ?",
-                (note_id, category)
+                (note_id, write.category)
+            )
+
+    def _stored_content(self, note_id):
+        row = self.conn.execute("SELECT content, codec FROM notes WHERE id = ?", (note_id,)).fetchone()
+        return decode_content(row[0], row[1]) if row else None
+
+    # Revision history: each save appends a revision holding either the full
+    # text (every CHECKPOINT_INTERVAL revisions) or a line delta from the one before.
+    def _record_revision(self, note_id, old_content, new_content):
+        """Append new_content to the note's history; call inside a write transaction."""
+        if old_content == new_content:
+            return
+        first, last, last_full = self.conn.execute(
+            "SELECT MIN(rev), MAX(rev), MAX(CASE WHEN full THEN rev END) FROM note_revisions WHERE note_id = ?",
+            (note_id,)
+        ).fetchone()
+        now = time.time()
+        if last is None:
+            if old_content is None:
+                last = 0
+            else:
+                # Note written before history existed: its current text becomes revision 1
+                last = last_full = first = 1
+                self.conn.execute(
+                    "INSERT INTO note_revisions (note_id, rev, created_at, full, data, codec) VALUES (?, ?, ?, 1, ?, ?)",
+                    (note_id, 1, now, *encode_content(old_content))
+                )
+                self._add_revision_attachments(note_id, 1, old_content)
+
+        rev = last + 1
+        full, data = 1, new_content
+        if last_full is not None and rev - last_full < CHECKPOINT_INTERVAL:
+            delta = line_diff(old_content, new_content)
+            if len(delta) < len(new_content):
+                full, data = 0, delta
+        # Large checkpoints (and deltas) are compressed like note bodies
+        self.conn.execute(
+            "INSERT INTO note_revisions (note_id, rev, created_at, full, data, codec) VALUES (?, ?, ?, ?, ?, ?)",
+            (note_id, rev, now, full, *encode_content(data))
+        )
+        self._add_revision_attachments(note_id, rev, new_content)
+        if first is not None and rev - first + 1 > MAX_REVISIONS_PER_NOTE + CHECKPOINT_INTERVAL:
+            # Pruned in steps, so a busy note isn't rewritten on every save
+            self._prune_revisions(note_id, MAX_REVISIONS_PER_NOTE)
+
+    def _revision_content(self, note_id, rev):
+        rows = self.conn.execute("""
+            SELECT data, codec FROM note_revisions
+            WHERE note_id = ? AND rev <= ? AND rev >= (
+                SELECT MAX(rev) FROM note_revisions WHERE note_id = ? AND rev <= ? AND full = 1
+            )
+            ORDER BY rev
+        """, (note_id, rev, note_id, rev)).fetchall()
+        if not rows:
+            return None
+        content = decode_content(*rows[0])
+        for delta, codec in rows[1:]:
+            content = apply_line_diff(content, decode_content(delta, codec))
+        return content
+
+    def _prune_revisions(self, note_id, keep):
+        row = self.conn.execute(
+            "SELECT rev, full FROM note_revisions WHERE note_id = ? ORDER BY rev DESC LIMIT 1 OFFSET ?",
+            (note_id, keep - 1)
+        ).fetchone()
+        if row is None:
+            return 0
+        oldest_kept, full = row
+        if not full:
+            # It becomes the base of the remaining chain, so store it in full
+            self.conn.execute(
+                "UPDATE note_revisions SET full = 1, data = ?, codec = ? WHERE note_id = ? AND rev = ?",
+                (*encode_content(self._revision_content(note_id, oldest_kept)), note_id, oldest_kept)
             )
+        self.conn.execute(
+            "DELETE FROM revision_attachments WHERE note_id = ? AND rev < ?",
+            (note_id, oldest_kept)
+        )
+        cursor = self.conn.execute(
+            "DELETE FROM note_revisions WHERE note_id = ? AND rev < ?",
+            (note_id, oldest_kept)
+        )
+        return cursor.rowcount
+
+    def list_revisions(self, note_id):
+        """Saved versions of a note, newest first: [{'rev', 'created_at', 'full', 'size'}]."""
+        self._read_barrier()
+        cursor = self.conn.execute("""
+            SELECT rev, created_at, full, LENGTH(CAST(data AS BLOB)) FROM note_revisions
+            WHERE note_id = ? ORDER BY rev DESC
+        """, (note_id,))
+        return [
+            {'rev': row[0], 'created_at': row[1], 'full': bool(row[2]), 'size': row[3]}
+            for row in cursor.fetchall()
+        ]
+
+    def get_revision(self, note_id, rev):
+        """The note's content as of a revision (None if that revision isn't kept)."""
+        self._read_barrier()
+        return self._revision_content(note_id, rev)
+
+    def restore_revision(self, note_id, rev):
+        """Make an earlier revision the current content (recorded as a new revision); returns it."""
+        content = self.get_revision(note_id, rev)
+        if content is not None:
+            self.save_note_content(note_id, content)
+        return content
+
+    def prune_revisions(self, note_id=None, keep=MAX_REVISIONS_PER_NOTE):
+        """Drop all but the newest `keep` revisions of one note (or of every note)."""
+        self._read_barrier()
+        with self.db.transaction():
+            if note_id is not None:
+                return self._prune_revisions(note_id, keep)
+            note_ids = [row[0] for row in self.conn.execute("SELECT DISTINCT note_id FROM note_revisions")]
+            return sum(self._prune_revisions(nid, keep) for nid in note_ids)
+
+    def _read_barrier(self):
+        """Commit queued writes so the read that follows sees them."""
+        if self.write_queue is not None and self.write_queue.has_pending():
+            self.write_queue.flush()
+
+    def flush_writes(self):
+        """Commit queued writes now; returns how many were written."""
+        return self.write_queue.flush() if self.write_queue is not None else 0
+
+    def write_stats(self):
+        """Counters of the write-behind queue (None when writes go straight to the database)."""
+        return self.write_queue.stats() if self.write_queue is not None else None
+
+    # Search methods:
+    @staticmethod
+    def _build_match_query(query):
+        """Turn free text into an FTS5 query; the last word is prefix-matched for search-as-you-type."""
+        tokens = _SEARCH_TOKEN.findall(query)
+        if not tokens:
+            return None
+        terms = [f'"{token}"' for token in tokens]
+        if not query[-1:].isspace():
+            terms[-1] += "*"
+        return " ".join(terms)
+
+    def search(self, query, category=None, limit=50):
+        """
+        Full-text search over note titles and content.
+        Returns bm25-ranked dicts with 'id', 'category', 'title' and a highlighted 'snippet'.
+        When more than SEARCH_RANK_CANDIDATES notes match, only the most recently
+        added of them are ranked.
+        """
+        match = self._build_match_query(query or "")
+        if match is None:
+            return []
+
+        self._read_barrier()
+        # The index is contentless: rank the matching rowids there (rank is the
+        # weighted bm25), then read only the top rows' titles and bodies. Only the
+        # newest SEARCH_RANK_CANDIDATES matches are scored; walking the index in
+        # rowid order lets it stop there instead of scoring every match.
+        if category is None:
+            candidates = """
+                SELECT rowid, rank FROM notes_fts WHERE notes_fts MATCH ?
+                ORDER BY rowid DESC LIMIT ?
+            """
+            params = [match, SEARCH_RANK_CANDIDATES, limit]
+        else:
+            candidates = """
+                SELECT f.rowid, f.rank FROM notes_fts f JOIN notes n ON n.rowid = f.rowid
+                WHERE notes_fts MATCH ? AND n.category = ? ORDER BY f.rowid DESC LIMIT ?
+            """
+            params = [match, category, SEARCH_RANK_CANDIDATES, limit]
+        rows = self.conn.execute(f"""
+            SELECT n.id, n.category, n.title, n.content, n.codec
+            FROM (SELECT rowid, rank FROM ({candidates}) ORDER BY rank LIMIT ?) r
+            JOIN notes n ON n.rowid = r.rowid
+            ORDER BY r.rank
+        """, params).fetchall()
+
+        terms = [fold(token) for token in _SEARCH_TOKEN.findall(query)]
+        prefix = not query[-1:].isspace()
+        return [
+            {'id': row[0], 'category': row[1], 'title': row[2],
+             'snippet': make_snippet(decode_content(row[3], row[4]), terms, prefix)}
+            for row in rows
+        ]
 
     # Dashboard stats methods:
+    def get_category_stats(self):
+        """
+        Return dashboard counters in one query, read from the trigger-maintained tables:
+        {'categories': {category: {'count': n, 'bytes': b}}, 'tasks_completed': n}
+        """
+        self._read_barrier()
+        cursor = self.conn.execute("""
+            SELECT category, note_count, total_bytes FROM category_stats
+            UNION ALL
+            SELECT NULL, completed, 0 FROM task_stats
+        """)
+        rows = cursor.fetchall()
+
+        stats = {'categories': {}, 'tasks_completed': 0}
+        for category, count, total_bytes in rows:
+            if category is None:
+                stats['tasks_completed'] = count
+            elif count:
+                stats['categories'][category] = {'count': count, 'bytes': total_bytes}
+        return stats
+
     def count_notes(self):
-        with self.conn:
-            cursor = self.conn.execute("SELECT COUNT(*) FROM notes")
-            return cursor.fetchone()[0]
+        self._read_barrier()
+        cursor = self.conn.execute("SELECT SUM(note_count) FROM category_stats")
+        result = cursor.fetchone()[0]
+        return result if result is not None else 0
 
     def count_completed_tasks(self):
-        with self.conn:
-            cursor = self.conn.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1")
-            return cursor.fetchone()[0]
+        self._read_barrier()
+        cursor = self.conn.execute("SELECT completed FROM task_stats")
+        row = cursor.fetchone()
+        return row[0] if row else 0
 
     def get_used_storage(self):
-        # Proxy: sum of content lengths in all notes
-        with self.conn:
-            cursor = self.conn.execute("SELECT SUM(LENGTH(content)) FROM notes")
-            result = cursor.fetchone()[0]
-            return result if result is not None else 0
+        # Proxy: sum of content sizes (bytes) in all notes, as typed
+        return self.get_storage_usage()['logical']
+
+    def get_storage_usage(self):
+        """
+        Note body bytes as typed ('logical') and as stored after compression
+        ('physical'), and the bytes the whole database uses ('database': bodies,
+        history, indexes and the search index, excluding free pages).
+        """
+        self._read_barrier()
+        cursor = self.conn.execute("SELECT SUM(total_bytes), SUM(stored_bytes) FROM category_stats")
+        logical, physical = cursor.fetchone()
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        pages = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        free = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return {'logical': logical or 0, 'physical': physical or 0, 'database': (pages - free) * page_size}
 
     #def get_max_storage(self):
         #return 1_000_000
@@ -97,36 +1068,45 @@ class NoteModel:
     def add_sticky_note(self):
         sticky_category = "sticky"
         new_id = str(uuid.uuid4())
-        with self.conn:
-            self.conn.execute(
-                "INSERT INTO notes (id, category, title, content) VALUES (?, ?, ?, ?)",
-                (new_id, sticky_category, "Sticky Note", "")
-            )
+        self._write(new_id, PendingWrite(INSERT, sticky_category, "Sticky Note", ""))
         return new_id
 
     def delete_sticky_note(self, note_id):
         """Delete a sticky note by its ID."""
-        with self.conn:
-            self.conn.execute(
-                "DELETE FROM notes WHERE id = ? AND category = ?",
-                (note_id, "sticky")
-            )
+        self._write(note_id, PendingWrite(DELETE, "sticky"))
+
+    def get_sticky_notes(self):
+        """Return every sticky note as {'id', 'geometry'}; geometry is None until saved once."""
+        self._read_barrier()
+        cursor = self.conn.execute("""
+            SELECT n.id, g.geometry FROM notes n
+            LEFT JOIN sticky_geometry g ON g.note_id = n.id
+            WHERE n.category = 'sticky'
+            ORDER BY n.title, n.id
+        """)
+        return [{'id': row[0], 'geometry': row[1]} for row in cursor.fetchall()]
+
+    def save_sticky_geometry(self, note_id, geometry):
+        """Store a sticky note window's saved geometry (opaque bytes)."""
+        with self.db.transaction():
+            self.conn.execute("""
+                INSERT INTO sticky_geometry (note_id, geometry) VALUES (?, ?)
+                ON CONFLICT (note_id) DO UPDATE SET geometry = excluded.geometry
+            """, (note_id, geometry))
 
     def get_note_content(self, note_id):
-        with self.conn:
-            cursor = self.conn.execute(
-                "SELECT content FROM notes WHERE id = ?",
-                (note_id,)
-            )
-            row = cursor.fetchone()
-            return row[0] if row else ""
+        note = self._load_note(note_id)
+        return note['content'] if note else ""
 
     def save_note_content(self, note_id, content):
-        with self.conn:
-            self.conn.execute(
-                "UPDATE notes SET content = ? WHERE id = ?",
-                (content, note_id)
-            )
+        self._write(note_id, PendingWrite(CONTENT, content=content))
+
+    def recover_autosaves(self):
+        """Unsaved editor text left in autosave journals: [{'note_id', 'category', 'content', 'path'}]."""
+        def stored_content(note_id):
+            note = self._load_note(note_id)
+            return note['content'] if note else None
+        return self.journals.recover(stored_content)
 
     # Method for consistency with helpers
     def update_note(self, category, note_id, title, content):
@@ -0,0 +1,45 @@
+import difflib
+import json
+
+# Every Nth revision of a note is stored in full, so rebuilding any version
+# replays at most N - 1 deltas.
+CHECKPOINT_INTERVAL = 20
+
+# Revisions kept per note; older ones are pruned (see NoteModel.prune_revisions)
+MAX_REVISIONS_PER_NOTE = 100
+
+
+def line_diff(old, new):
+    """
+    Encode new as line edits against old (JSON text):
+    ["=", n] keeps n lines, ["-", n] drops n lines, ["+", [lines]] inserts lines.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", new_lines[j1:j2]])
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_line_diff(old, delta):
+    """Rebuild the text a line_diff() delta was made from old into."""
+    old_lines = old.splitlines(keepends=True)
+    out = []
+    pos = 0
+    for op, arg in json.loads(delta):
+        if op == "=":
+            out.extend(old_lines[pos:pos + arg])
+            pos += arg
+        elif op == "-":
+            pos += arg
+        else:
+            out.extend(arg)
+    return "".join(out)
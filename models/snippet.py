@@ -0,0 +1,66 @@
+import html
+import re
+import unicodedata
+from collections import deque
+
+# Words shown around the first match, as FTS5 snippet()'s token count
+SNIPPET_WORDS = 12
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def fold(word):
+    """Case- and accent-insensitive form of a word, as the search tokenizer sees it."""
+    if word.isascii():
+        return word.lower()
+    decomposed = unicodedata.normalize("NFKD", word.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def make_snippet(text, terms, prefix=False, words=SNIPPET_WORDS):
+    """
+    HTML snippet of text around the first word matching one of terms (folded
+    words; with prefix, the last term also matches words starting with it).
+    Matches are wrapped in <b>…</b> and cut ends marked with '…', like FTS5's
+    snippet(). Only the text up to the end of the snippet is scanned.
+    """
+    exact = set(terms[:-1] if prefix else terms)
+    stem = terms[-1] if prefix and terms else None
+
+    def matches(word):
+        folded = fold(word)
+        return folded in exact or (stem is not None and folded.startswith(stem))
+
+    before = words // 3
+    head = []                    # opening words, shown if nothing in the body matches
+    recent = deque(maxlen=before)
+    window = None
+    for m in _WORD.finditer(text):
+        hit = matches(m.group())
+        if window is None:
+            if not hit:
+                if len(head) < words:
+                    head.append((m, False))
+                recent.append((m, False))
+                continue
+            window = list(recent)
+        window.append((m, hit))
+        if len(window) >= words:
+            break
+    if window is None:
+        window = head
+    if not window:
+        return ""
+
+    start, end = window[0][0].start(), window[-1][0].end()
+    parts = ["…" if start > 0 else ""]
+    pos = start
+    for m, hit in window:
+        if hit:
+            parts.append(html.escape(text[pos:m.start()]))
+            parts.append(f"<b>{html.escape(m.group())}</b>")
+            pos = m.end()
+    parts.append(html.escape(text[pos:end]))
+    if _WORD.search(text, end):
+        parts.append("…")
+    return "".join(parts)
@@ -0,0 +1,144 @@
+import atexit
+import threading
+from collections import OrderedDict
+
+INSERT = "insert"
+UPDATE = "update"      # title + content, guarded by category
+CONTENT = "content"    # content only
+DELETE = "delete"
+
+
+class PendingWrite:
+    """One queued mutation of a note (the note id is the queue key)."""
+
+    __slots__ = ("kind", "category", "title", "content")
+
+    def __init__(self, kind, category=None, title=None, content=None):
+        self.kind = kind
+        self.category = category
+        self.title = title
+        self.content = content
+
+    def __repr__(self):
+        return f"PendingWrite({self.kind!r}, category={self.category!r}, title={self.title!r})"
+
+
+def coalesce(older, newer):
+    """
+    Merge two writes to the same note into the one write that has the same
+    final effect. Returns None when nothing needs writing at all (insert + delete).
+    """
+    if older.kind == DELETE:
+        return older  # the row is gone; later updates would match nothing
+    if newer.kind == DELETE:
+        if older.kind == INSERT:
+            # Deleting under another category would not have matched the new row
+            return None if newer.category == older.category else older
+        return newer
+    if older.kind == INSERT:
+        if newer.kind == UPDATE and newer.category != older.category:
+            return older  # edit_note would not have matched this row
+        title = newer.title if newer.kind == UPDATE else older.title
+        return PendingWrite(INSERT, older.category, title, newer.content)
+    if newer.kind == CONTENT and older.kind == UPDATE:
+        return PendingWrite(UPDATE, older.category, older.title, newer.content)
+    return newer
+
+
+class WriteBehindQueue:
+    """
+    Buffers note writes and commits them in batches.
+
+    Writes are keyed by note id and coalesced (last write wins), then handed to
+    `apply_batch` as one list, which the model runs in a single transaction.
+    A background thread flushes `interval` seconds after the first queued write;
+    flush() may be called at any time (read barriers, shutdown) to write now.
+    """
+
+    def __init__(self, apply_batch, interval=0.5):
+        self.apply_batch = apply_batch
+        self.interval = interval
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()         # guards _pending and counters
+        self._flush_lock = threading.Lock()   # keeps batches in order
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self.queued = 0
+        self.coalesced = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.failures = 0
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        # Last chance for queued writes if the owner never calls close()
+        atexit.register(self.flush)
+
+    def enqueue(self, note_id, write):
+        with self._lock:
+            self.queued += 1
+            older = self._pending.pop(note_id, None)
+            if older is not None:
+                self.coalesced += 1
+                write = coalesce(older, write)
+            if write is not None:
+                self._pending[note_id] = write
+        self._wakeup.set()
+
+    def has_pending(self):
+        return bool(self._pending)
+
+    def flush(self):
+        """Write everything queued so far; returns the number of writes applied."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = list(self._pending.items())
+                self._pending.clear()
+            try:
+                self.apply_batch(batch)
+            except Exception:
+                with self._lock:
+                    self.failures += 1
+                    # Put the batch back underneath anything queued meanwhile
+                    for note_id, write in batch:
+                        newer = self._pending.pop(note_id, None)
+                        merged = coalesce(write, newer) if newer is not None else write
+                        if merged is not None:
+                            self._pending[note_id] = merged
+                raise
+            with self._lock:
+                self.flushed += len(batch)
+                self.flushes += 1
+            return len(batch)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            # Let more writes arrive (e.g. further autosaves) before committing
+            if self._stop.wait(self.interval):
+                return
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # kept queued; retried on the next write, flush() or close()
+
+    def close(self):
+        """Stop the background thread and flush whatever is left."""
+        atexit.unregister(self.flush)
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'queued': self.queued,
+                'coalesced': self.coalesced,
+                'flushed': self.flushed,
+                'flushes': self.flushes,
+                'failures': self.failures,
+                'pending': len(self._pending),
+            }
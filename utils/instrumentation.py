@@ -0,0 +1,180 @@
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import re
+import threading
+import time
+import types
+from collections import deque
+
+# Queries slower than this are written to the slow query log
+SLOW_QUERY_MS = 20.0
+SLOW_QUERY_HISTORY = 200
+
+slow_query_log = logging.getLogger("scratchpad.slow_queries")
+
+# Literals are replaced so the same statement with different values aggregates together
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_X_LITERAL = re.compile(r"\bX'[0-9A-Fa-f]*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    sql = _X_LITERAL.sub("?", sql)
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class _Counter:
+    __slots__ = ("calls", "total", "max")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self):
+        return {'calls': self.calls, 'total_ms': round(self.total * 1000, 3),
+                'max_ms': round(self.max * 1000, 3),
+                'mean_ms': round(self.total * 1000 / self.calls, 3) if self.calls else 0.0}
+
+
+class Instrumentation:
+    """
+    Opt-in timing of model methods, controller handlers and SQL statements.
+
+    Nothing is wrapped or traced until enabled: instrument_class() only patches
+    classes when switched on (main.py does it for --instrument), so a normal run
+    calls the original methods directly.
+
+    SQL timings come from Connection.set_trace_callback, which reports when a
+    statement starts. A statement is timed until the next statement starts on
+    the same thread, the instrumented method that ran it returns or its
+    transaction ends (end_statement(), called by Database.transaction), so the
+    figure includes fetching its rows.
+    """
+
+    def __init__(self, enabled=False, slow_query_ms=SLOW_QUERY_MS):
+        self.enabled = enabled
+        self.slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.methods = {}
+        self.queries = {}
+        self.slow_queries = deque(maxlen=SLOW_QUERY_HISTORY)
+
+    # ---- methods -------------------------------------------------------
+    def instrument_class(self, cls, names=None, prefix=None):
+        """
+        Wrap cls's methods (by default every public one) with timers, if enabled.
+        Static and class methods are rewrapped in their own descriptor type.
+        """
+        if not self.enabled:
+            return
+        prefix = prefix or cls.__name__
+        if names is None:
+            names = [name for name, value in vars(cls).items()
+                     if isinstance(value, (types.FunctionType, staticmethod, classmethod))
+                     and not name.startswith("_")]
+        for name in names:
+            attr = vars(cls).get(name)
+            descriptor = type(attr) if isinstance(attr, (staticmethod, classmethod)) else None
+            func = attr.__func__ if descriptor is not None else attr
+            if func is None or getattr(func, "__instrumented__", False):
+                continue
+            timed = self._wrap(func, f"{prefix}.{name}")
+            setattr(cls, name, descriptor(timed) if descriptor is not None else timed)
+
+    def _wrap(self, func, label):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                self._end_statement(end)
+                self._record(self.methods, label, end - start)
+        timed.__instrumented__ = True
+        return timed
+
+    def _record(self, table, key, seconds):
+        with self._lock:
+            counter = table.get(key)
+            if counter is None:
+                counter = table[key] = _Counter()
+            counter.add(seconds)
+
+    # ---- SQL -----------------------------------------------------------
+    def trace(self, sql):
+        """set_trace_callback target: called as each statement starts."""
+        now = time.perf_counter()
+        current = getattr(self._local, "statement", None)
+        if current is not None and current[0] == sql:
+            return  # trigger programs re-report the statement that fired them
+        self._end_statement(now)
+        self._local.statement = (sql, now)
+
+    def end_statement(self):
+        """Stop timing this thread's current statement, e.g. once its transaction has ended."""
+        self._end_statement(time.perf_counter())
+
+    def _end_statement(self, now):
+        current = getattr(self._local, "statement", None)
+        if current is None:
+            return
+        self._local.statement = None
+        sql, start = current
+        seconds = now - start
+        normalized = normalize_sql(sql)
+        self._record(self.queries, normalized, seconds)
+        ms = seconds * 1000
+        if ms >= self.slow_query_ms:
+            entry = {'sql': normalized[:2000], 'ms': round(ms, 3),
+                     'thread': threading.current_thread().name, 'at': time.time()}
+            with self._lock:
+                self.slow_queries.append(entry)
+            slow_query_log.warning("%.1f ms [%s] %s", ms, entry['thread'], entry['sql'])
+
+    def log_to(self, path, max_bytes=1024 * 1024, backups=3):
+        """Write the slow query log to a rotating file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes,
+                                                       backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_query_log.addHandler(handler)
+        slow_query_log.setLevel(logging.WARNING)
+
+    # ---- reporting -----------------------------------------------------
+    def snapshot(self):
+        """Aggregated counters: {'methods': {...}, 'queries': {...}, 'slow_queries': [...]}."""
+        with self._lock:
+            return {
+                'methods': {k: c.as_dict() for k, c in self.methods.items()},
+                'queries': {k: c.as_dict() for k, c in self.queries.items()},
+                'slow_queries': list(self.slow_queries),
+            }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self.methods.clear()
+            self.queries.clear()
+            self.slow_queries.clear()
+
+
+# Shared instance, like utils.startup_profiler.profiler
+instrumentation = Instrumentation()
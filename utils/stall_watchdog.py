@@ -0,0 +1,111 @@
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PySide6.QtCore import QObject, QTimer
+
+# The main thread is stalled once a heartbeat is this late
+STALL_THRESHOLD_MS = 100
+HEARTBEAT_MS = 50
+# A stall still going after this long is logged straight away, in case it never ends
+HANG_REPORT_S = 5.0
+
+stall_log = logging.getLogger("scratchpad.stalls")
+
+
+class StallWatchdog(QObject):
+    """
+    Detects event loop stalls on the Qt main thread.
+
+    A QTimer on the main thread stamps a heartbeat every HEARTBEAT_MS; a
+    daemon thread checks it. When a heartbeat is more than threshold_ms late
+    the watchdog grabs the main thread's Python stack (sys._current_frames())
+    and, once the loop is running again, logs the stall's duration with that
+    stack. The stack is sampled as soon as the deadline passes, so it shows
+    what was blocking the loop, not whatever ran after it.
+    """
+
+    def __init__(self, threshold_ms=STALL_THRESHOLD_MS, heartbeat_ms=HEARTBEAT_MS, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.interval = heartbeat_ms / 1000
+        self.stall_count = 0
+        self._main_ident = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._beat()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _main_stack(self):
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return "(main thread stack unavailable)\n"
+        return "".join(traceback.format_stack(frame))
+
+    def _run(self):
+        # The heartbeat is expected every interval; it is late past interval + threshold
+        deadline = self.interval + self.threshold
+        poll = min(self.threshold, self.interval) / 2
+        stalled_beat = None
+        stack = None
+        reported = False
+        while not self._stop.wait(poll):
+            beat = self._last_beat
+            late = time.monotonic() - beat
+            if stalled_beat is None:
+                if late > deadline:
+                    stalled_beat = beat
+                    stack = self._main_stack()
+                    reported = False
+            elif beat != stalled_beat:
+                # The loop ran again: the stall lasted from the missed deadline to this beat
+                if not reported:
+                    self._report(beat - stalled_beat - self.interval, stack)
+                else:
+                    stall_log.warning("stall ended after %.0f ms", (beat - stalled_beat - self.interval) * 1000)
+                stalled_beat = None
+            elif not reported and late > HANG_REPORT_S:
+                self._report(late - self.interval, stack, ongoing=True)
+                reported = True
+
+    def _report(self, seconds, stack, ongoing=False):
+        self.stall_count += 1
+        state = "still stalled after" if ongoing else "stalled for"
+        stall_log.warning("main thread %s %.0f ms; stack when the deadline was missed:\n%s",
+                          state, seconds * 1000, stack)
+
+    @staticmethod
+    def log_to(path, max_bytes=1024 * 1024, backups=3):
+        """Write the stall log to a rotating file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes,
+                                                       backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        stall_log.addHandler(handler)
+        stall_log.setLevel(logging.WARNING)
@@ -0,0 +1,55 @@
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """
+    Records how long each import and construction step of startup takes.
+    Disabled by default; main.py switches it on for --profile-startup.
+    """
+
+    def __init__(self, enabled=False, stream=None):
+        self.enabled = enabled
+        self.stream = stream
+        self.origin = time.perf_counter()
+        self.spans = []  # (offset_ms, duration_ms, depth, name)
+        self._depth = 0
+        self._reported = False
+
+    @contextmanager
+    def span(self, name):
+        """Time a block; nested spans are indented in the report."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            end = time.perf_counter()
+            entry = ((start - self.origin) * 1000, (end - start) * 1000, self._depth, name)
+            self.spans.append(entry)
+            if self._reported:
+                # Work deferred past the first window (e.g. lazily built widgets)
+                self._write(f"[startup] deferred {entry[3]}: {entry[1]:.1f} ms (at {entry[0]:.1f} ms)")
+
+    def _write(self, line):
+        print(line, file=self.stream or sys.stderr)
+
+    def report(self, milestone="first window interactive"):
+        """Print the spans recorded so far, in start order, and the total."""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        total = (time.perf_counter() - self.origin) * 1000
+        self._write("[startup] profile (ms since process start of profiler)")
+        for offset, duration, depth, name in sorted(self.spans):
+            self._write(f"[startup] {offset:8.1f} {duration:8.1f}  {'  ' * depth}{name}")
+        self._write(f"[startup] {milestone}: {total:.1f} ms")
+
+
+# Shared instance so any module can add spans to the startup report
+profiler = StartupProfiler()
@@ -0,0 +1,124 @@
+import numpy as np
+from PySide6.QtWidgets import QSizePolicy
+from PySide6.QtCore import Qt, QTimer
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+
+class AnimatedGraph(FigureCanvas):
+    """Responsive, smooth, transparent line graph for the dashboard."""
+
+    def __init__(self, parent=None, update_interval=30):
+        self.fig = Figure(figsize=(6, 3), dpi=100)
+        self.fig.patch.set_alpha(0.0)  # Transparent
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setStyleSheet("background-color:transparent;")
+
+        self.axes = self.fig.add_subplot(111)
+        self.axes.patch.set_alpha(0.0)
+
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # Stats
+        self.categories = ["Contacts", "Bookmarks", "CoPilot", "Notes"]
+        self.current_values = np.array([0, 0, 0, 0], dtype=float)
+        self.target_values = np.array([0, 0, 0, 0], dtype=float)
+
+        # Animation timer: only runs while values are moving and the graph is visible
+        self.timer = QTimer(self)
+        self.timer.setInterval(update_interval)  # milliseconds
+        self.timer.timeout.connect(self._animate_step)
+
+        self._build_graph()
+
+    def _build_graph(self):
+        """Create the artists once; animation frames only update their data."""
+        self.fig.patch.set_facecolor('none')
+        self.fig.patch.set_alpha(0.0)
+        self.axes.patch.set_facecolor('none')
+
+        self._x = np.arange(len(self.categories), dtype=float)
+
+        # Line with markers
+        self._line, = self.axes.plot(self._x, self.current_values, marker='o',
+                                     color="#2E86C1", linewidth=2, markersize=6)
+        self._fill = self.axes.fill_between(self._x, self.current_values, 0,
+                                            color="#2E86C1", alpha=0.1)
+
+        # Remove spines and ticks
+        for spine in self.axes.spines.values():
+            spine.set_visible(False)
+        self.axes.set_xticks(self._x)
+        self.axes.set_xticklabels(self.categories)
+        self.axes.set_xlim(-0.3, len(self.categories) - 0.7)
+        self.axes.set_yticks([])
+        self.axes.grid(False)
+
+        # Labels above points
+        self._labels = [
+            self.axes.text(x, 0, "0", ha='center', va='bottom', fontsize=10, clip_on=False)
+            for x in self._x
+        ]
+
+        # Fixed margins instead of constrained_layout, so a frame never runs a layout pass
+        self.fig.subplots_adjust(left=0.03, right=0.97, top=0.92, bottom=0.12)
+
+        self.plot_graph()
+
+    def plot_graph(self):
+        """Push current_values into the existing artists and schedule a repaint."""
+        values = self.current_values
+        self._line.set_ydata(values)
+
+        verts = [(self._x[0], 0.0)]
+        verts += list(zip(self._x, values))
+        verts.append((self._x[-1], 0.0))
+        self._fill.set_verts([verts])
+
+        max_val = max(max(values), 10)
+        for label, x, y in zip(self._labels, self._x, values):
+            label.set_position((x, y + max_val * 0.03))
+            label.set_text(f"{y:.0f}")
+
+        # Set Y limits with padding at bottom
+        bottom_padding = max(0.05 * max_val, 1)
+        self.axes.set_ylim(-bottom_padding, max_val + max_val * 0.15)
+
+        self.draw_idle()
+
+    def _animate_step(self):
+        """Smoothly move current_values towards target_values."""
+        diff = self.target_values - self.current_values
+        step = diff * 0.1  # smoothing factor
+        self.current_values += step
+        if np.all(np.abs(diff) < 0.01):
+            self.current_values = self.target_values.copy()  # snap to target
+            self.timer.stop()  # converged: nothing left to animate
+        self.plot_graph()
+
+    def _converged(self):
+        return np.array_equal(self.current_values, self.target_values)
+
+    def update_stats(self, contacts=None, bookmarks=None, copilot=None, notes=None):
+        """Set new target values for smooth transition."""
+        if contacts is not None:
+            self.target_values[0] = contacts
+        if bookmarks is not None:
+            self.target_values[1] = bookmarks
+        if copilot is not None:
+            self.target_values[2] = copilot
+        if notes is not None:
+            self.target_values[3] = notes
+        if not self._converged() and self.isVisible():
+            self.timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._converged():
+            self.timer.start()
+
+    def hideEvent(self, event):
+        self.timer.stop()  # don't animate behind the notes view
+        super().hideEvent(event)
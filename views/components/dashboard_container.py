@@ -9,11 +9,11 @@ class DashboardContainer(QWidget):
     and handles showing/hiding cleanly for MainView.
     """
 
-    def __init__(self, model):
+    def __init__(self, model, async_model=None):
         super().__init__()
 
         # Dashboard instance
-        self.dashboard_view = DashboardView(model)
+        self.dashboard_view = DashboardView(model, async_model)
 
         # Layout
         layout = QVBoxLayout(self)
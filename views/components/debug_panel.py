@@ -0,0 +1,119 @@
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTabWidget, QTableWidget,
+    QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+
+REFRESH_MS = 1000
+
+
+class _NumberItem(QTableWidgetItem):
+    """Sorts numerically instead of as text."""
+
+    def __init__(self, value):
+        super().__init__(f"{value:,.3f}" if isinstance(value, float) else f"{value:,}")
+        self.value = value
+        self.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+    def __lt__(self, other):
+        return self.value < getattr(other, "value", 0)
+
+
+class InstrumentationPanel(QDialog):
+    """
+    Live view of the instrumentation counters (run with --instrument):
+    per-method and per-query call counts and times, and recent slow queries.
+    """
+
+    def __init__(self, instrumentation, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Performance Counters")
+        self.resize(900, 500)
+        self.instrumentation = instrumentation
+
+        layout = QVBoxLayout(self)
+        self.tabs = QTabWidget()
+        self.methods_table = self._make_table(["Method", "Calls", "Total ms", "Mean ms", "Max ms"])
+        self.queries_table = self._make_table(["Query", "Calls", "Total ms", "Mean ms", "Max ms"])
+        self.slow_table = self._make_table(["Query", "ms", "Thread"])
+        self.tabs.addTab(self.methods_table, "Methods")
+        self.tabs.addTab(self.queries_table, "Queries")
+        self.tabs.addTab(self.slow_table, "Slow Queries")
+        layout.addWidget(self.tabs)
+
+        btn_layout = QHBoxLayout()
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self._reset)
+        btn_layout.addWidget(reset_btn)
+        dump_btn = QPushButton("Dump to JSON…")
+        dump_btn.clicked.connect(self.dump)
+        btn_layout.addWidget(dump_btn)
+        btn_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+        # Refresh only while the panel is open
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    @staticmethod
+    def _make_table(headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSortingEnabled(True)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        return table
+
+    @staticmethod
+    def _fill(table, rows):
+        sort_column = table.horizontalHeader().sortIndicatorSection()
+        sort_order = table.horizontalHeader().sortIndicatorOrder()
+        table.setSortingEnabled(False)
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                item = QTableWidgetItem(value) if isinstance(value, str) else _NumberItem(value)
+                if c == 0:
+                    item.setToolTip(value)
+                table.setItem(r, c, item)
+        table.setSortingEnabled(True)
+        table.sortItems(sort_column, sort_order)
+
+    def _counter_rows(self, counters):
+        return [(name, c['calls'], c['total_ms'], c['mean_ms'], c['max_ms']) for name, c in counters.items()]
+
+    def refresh(self):
+        snapshot = self.instrumentation.snapshot()
+        self._fill(self.methods_table, self._counter_rows(snapshot['methods']))
+        self._fill(self.queries_table, self._counter_rows(snapshot['queries']))
+        self._fill(self.slow_table, [(q['sql'], q['ms'], q['thread']) for q in snapshot['slow_queries']])
+
+    def _reset(self):
+        self.instrumentation.reset()
+        self.refresh()
+
+    def dump(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Dump Counters", "counters.json", "JSON (*.json)")
+        if path:
+            dump_counters(self, self.instrumentation, path)
+
+    def showEvent(self, event):
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+
+def dump_counters(parent, instrumentation, path):
+    try:
+        instrumentation.dump(path)
+    except OSError as e:
+        QMessageBox.critical(parent, "Dump Counters", f"Could not write {path}:\n{e}")
@@ -1,13 +1,20 @@
 import os
-import uuid
-import shutil
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout,
     QFileDialog, QMessageBox
 )
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt, QSignalBlocker
+from PySide6.QtGui import QTextDocument
+from PySide6.QtCore import QSignalBlocker, QTimer, QUrl
+
+from helpers.thumbnail_loader import ThumbnailLoader, placeholder_image
+from models.attachments import AttachmentStore
+
+# QTextEdit's plain text stands an embedded image in with this character
+OBJECT_REPLACEMENT_CHAR = "\ufffc"
+
+# Pause in typing after which the change is appended to the autosave journal
+JOURNAL_DELAY_MS = 400
 
 
 class EditorPanel(QDialog):
@@ -15,13 +22,14 @@ class EditorPanel(QDialog):
     Editor dialog for editing note content (with optional embedded images).
     """
 
-    def __init__(self, parent=None, title="", content="", save_callback=None):
+    def __init__(self, parent=None, title="", content="", save_callback=None, attachment_store=None,
+                 journal=None):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.resize(500, 400)
 
         self.save_callback = save_callback
-        self._image_refs = []
+        self.attachment_store = attachment_store if attachment_store is not None else AttachmentStore()
         self._is_saving = False  # 🟢 Guard to prevent re-entrant opens
 
         # === Layout ===
@@ -32,9 +40,24 @@ class EditorPanel(QDialog):
         self.text_edit.setAcceptRichText(False)
         layout.addWidget(self.text_edit)
 
+        # Thumbnails are decoded off the GUI thread and swapped in for placeholders
+        self._thumbnails = ThumbnailLoader(self.attachment_store.thumbnail_dir, parent=self)
+        self._thumbnails.thumbnail_ready.connect(self._on_thumbnail_ready)
+
         # Load initial content (handles image tags)
         self._render_content_with_images(content)
 
+        # Unsaved changes go to the autosave journal (if any) on each pause in typing;
+        # whoever opened the editor discards it once the save is committed.
+        self.journal = journal
+        self._journal_timer = QTimer(self)
+        self._journal_timer.setSingleShot(True)
+        self._journal_timer.setInterval(JOURNAL_DELAY_MS)
+        self._journal_timer.timeout.connect(self._record_journal)
+        if journal is not None:
+            self.text_edit.textChanged.connect(self._journal_timer.start)
+            self.finished.connect(lambda _: self._journal_timer.stop())
+
         # --- Buttons ---
         btn_layout = QHBoxLayout()
         layout.addLayout(btn_layout)
@@ -61,20 +84,36 @@ class EditorPanel(QDialog):
         for line in content.splitlines():
             if line.startswith("[image:") and line.endswith("]"):
                 img_filename = line[len("[image:"):-1]
-                img_path = os.path.join("data", img_filename)
+                img_path = self.attachment_store.path(img_filename)
 
                 if os.path.exists(img_path):
-                    pixmap = QPixmap(img_path).scaled(
-                        50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                    cursor.insertImage(pixmap.toImage())
-                    cursor.insertBlock()
-                    self._image_refs.append(pixmap)
+                    self._insert_thumbnail(cursor, img_path)
+                    # Keep the tag in the text so saving preserves the reference
+                    cursor.insertText(line + "\n")
                 else:
                     cursor.insertText(f"[Failed to load image: {img_filename}]\n")
             else:
                 cursor.insertText(line + "\n")
 
+    @staticmethod
+    def _thumbnail_url(img_path):
+        return QUrl(f"thumbnail:{img_path}")
+
+    def _insert_thumbnail(self, cursor, img_path):
+        """Insert a placeholder image now and request the real thumbnail."""
+        url = self._thumbnail_url(img_path)
+        document = self.text_edit.document()
+        if document.resource(QTextDocument.ImageResource, url) is None:
+            document.addResource(QTextDocument.ImageResource, url, placeholder_image())
+            self._thumbnails.request(img_path)
+        cursor.insertImage(url.toString())
+
+    def _on_thumbnail_ready(self, img_path, image):
+        document = self.text_edit.document()
+        document.addResource(QTextDocument.ImageResource, self._thumbnail_url(img_path), image)
+        # Re-layout so every occurrence picks up the new resource and its real size
+        document.markContentsDirty(0, document.characterCount())
+
     def _insert_image(self):
         """Insert a selected image into the editor."""
         filepath, _ = QFileDialog.getOpenFileName(
@@ -83,24 +122,24 @@ class EditorPanel(QDialog):
         if not filepath:
             return
 
-        img_folder = "data"
-        os.makedirs(img_folder, exist_ok=True)
+        # Stored by content hash: inserting the same image again reuses the file
+        new_name = self.attachment_store.put(filepath)
+        new_path = self.attachment_store.path(new_name)
 
-        ext = os.path.splitext(filepath)[1]
-        new_name = f"{uuid.uuid4()}{ext}"
-        new_path = os.path.join(img_folder, new_name)
-
-        shutil.copy(filepath, new_path)
-
-        pixmap = QPixmap(new_path).scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         cursor = self.text_edit.textCursor()
-        cursor.insertImage(pixmap.toImage())
-        cursor.insertText(f"\n[image:{new_name}]\n")
-
-        self._image_refs.append(pixmap)
+        if cursor.positionInBlock() > 0:
+            cursor.insertBlock()  # the tag must be on a line of its own
+        self._insert_thumbnail(cursor, new_path)
+        cursor.insertText(f"[image:{new_name}]\n")
 
 
     # SAVE HANDLING
+    def _plain_content(self):
+        return self.text_edit.toPlainText().replace(OBJECT_REPLACEMENT_CHAR, "")
+
+    def _record_journal(self):
+        self.journal.record(self._plain_content())
+
     def save_note(self):
         """Handles Save button logic safely (prevents reopen)."""
         if self._is_saving:
@@ -108,7 +147,7 @@ class EditorPanel(QDialog):
 
         self._is_saving = True
 
-        new_content = self.text_edit.toPlainText().strip()
+        new_content = self._plain_content().strip()
         if not new_content:
             QMessageBox.warning(self, "Empty Note", "Note content cannot be empty.")
             self._is_saving = False
@@ -0,0 +1,212 @@
+import time
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, Signal
+
+from models.model import LIST_ORDERS, LIST_PAGE_SIZE, NoteModel
+
+
+class NoteListModel(QAbstractListModel):
+    """
+    List model for the note titles of one category.
+
+    Rows are loaded from the database in pages as the view scrolls
+    (canFetchMore/fetchMore), keyset-paged with NoteModel.list_notes in the
+    current order (title, or most recently updated/created first), so opening
+    a large category only reads the first screenful. Loaded rows are also kept
+    by id; a row's position is found by binary search on its sort key, so
+    inserting, removing or moving one note never renumbers the rows after it.
+
+    After a mutation the caller applies it with insert_note/remove_note/update_title
+    instead of reloading, which keeps scroll position and selection. Rows that sort
+    past the last loaded page are left for fetchMore to pick up.
+    """
+
+    IdRole = Qt.ItemDataRole.UserRole
+    PAGE_SIZE = LIST_PAGE_SIZE
+
+    rows_loaded = Signal()  # emitted after each page (or result set) is applied
+
+    def __init__(self, async_model, order="title", parent=None):
+        super().__init__(parent)
+        self.async_model = async_model
+        self.category = None
+        self.order = order
+        self._rows = []
+        self._notes = {}  # id -> loaded row
+        self._has_more = False
+        self._fetching = False
+        self._paged = False  # True for a category listing, False for a fixed result set
+        self._generation = 0  # bumped on every reset; late pages from older loads are dropped
+
+    # ---------------- Qt model interface ----------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        note = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return note["title"]
+        if role == self.IdRole:
+            return note["id"]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return note.get("snippet")
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        after = NoteModel.list_cursor(self.order, self._rows[-1]) if self._rows else None
+        generation = self._generation
+        self.async_model.submit(
+            "list_notes", self.category, self.order, after=after, limit=self.PAGE_SIZE,
+            channel="note_list", callback=lambda rows: self._append_page(generation, rows)
+        )
+
+    # ---------------- Loading ----------------
+    def set_category(self, category):
+        """Show a category, (re)loading it from the first page."""
+        self._reset([], category=category, has_more=category is not None)
+        self.fetchMore()
+
+    def set_order(self, order):
+        """Change the sort order (a LIST_ORDERS key), reloading the category."""
+        if order not in LIST_ORDERS:
+            raise ValueError(f"Unknown note order: {order}")
+        self.order = order
+        if self._paged:
+            self.set_category(self.category)
+
+    def set_rows(self, notes):
+        """Show a fixed result set (e.g. search results) with no further paging."""
+        self._reset(list(notes), category=self.category, has_more=False)
+        self.rows_loaded.emit()
+
+    def clear(self):
+        self._reset([], category=None, has_more=False)
+
+    def _reset(self, rows, category, has_more):
+        self._generation += 1
+        self.async_model.cancel("note_list")
+        self.beginResetModel()
+        self.category = category
+        self._paged = has_more
+        self._rows = rows
+        self._notes = {note["id"]: note for note in rows}
+        self._has_more = has_more
+        self._fetching = False
+        self.endResetModel()
+
+    def _append_page(self, generation, rows):
+        if generation != self._generation:
+            return
+        self._fetching = False
+        self._has_more = len(rows) == self.PAGE_SIZE
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._notes.update((note["id"], note) for note in rows)
+            self._rows.extend(rows)
+            self.endInsertRows()
+        self.rows_loaded.emit()
+
+    # ---------------- Lookup ----------------
+    def row_for_id(self, note_id):
+        """Row of a loaded note, or -1."""
+        note = self._notes.get(note_id)
+        if note is None:
+            return -1
+        if self._paged:
+            row = self._insert_position(self._sort_key(note))
+            if row < len(self._rows) and self._rows[row] is note:
+                return row
+        # A fixed result set (search results) isn't in sort order, and is small
+        return next(row for row, loaded in enumerate(self._rows) if loaded is note)
+
+    def index_for_id(self, note_id):
+        row = self.row_for_id(note_id)
+        return self.index(row, 0) if row >= 0 else QModelIndex()
+
+    def note_id(self, row):
+        return self._rows[row]["id"] if 0 <= row < len(self._rows) else None
+
+    # ---------------- Incremental updates ----------------
+    def _sort_key(self, note):
+        return NoteModel.list_cursor(self.order, note)
+
+    def _insert_position(self, key):
+        """Binary search for where a key belongs among the loaded rows."""
+        descending = LIST_ORDERS[self.order][1] == "DESC"
+        low, high = 0, len(self._rows)
+        while low < high:
+            mid = (low + high) // 2
+            mid_key = self._sort_key(self._rows[mid])
+            if (mid_key > key) if descending else (mid_key < key):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    @staticmethod
+    def _stamped(note, **changes):
+        """A row with the timestamps the database gives a write made now."""
+        now = time.time()
+        return {"created_at": now, "updated_at": now, **note, **changes}
+
+    def insert_note(self, note):
+        """Insert a newly added note ({'id', 'title'}) at its sorted position."""
+        if not self._paged or note["id"] in self._notes:
+            return
+        note = self._stamped(note)
+        row = self._insert_position(self._sort_key(note))
+        if row == len(self._rows) and self._has_more:
+            return  # sorts after the loaded pages; fetchMore will bring it in
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, note)
+        self._notes[note["id"]] = note
+        self.endInsertRows()
+
+    def remove_note(self, note_id):
+        """Remove a deleted note if it is loaded."""
+        row = self.row_for_id(note_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._notes[note_id]
+        self.endRemoveRows()
+
+    def update_title(self, note_id, title):
+        """Retitle a loaded note, moving it if its sorted position changed."""
+        row = self.row_for_id(note_id)
+        if row < 0:
+            return
+        note = self._rows[row]
+        note["title"] = title
+        note["updated_at"] = time.time()  # the edit also moves it to the top of "updated"
+
+        if self._paged:
+            del self._rows[row]
+            dest = self._insert_position(self._sort_key(note))
+            self._rows.insert(row, note)
+            if dest == len(self._rows) - 1 and dest != row and self._has_more:
+                # Now sorts after the loaded pages; fetchMore will bring it back
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                del self._notes[note_id]
+                self.endRemoveRows()
+                return
+            if dest != row:
+                # Qt's destination is expressed in pre-move coordinates
+                self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), dest + 1 if dest > row else dest)
+                self._rows.insert(dest, self._rows.pop(row))
+                self.endMoveRows()
+                row = dest
+
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
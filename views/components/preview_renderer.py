@@ -0,0 +1,139 @@
+import hashlib
+import html
+import re
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtGui import QTextCursor
+
+# Applied to HTML-escaped text, so a URL ends at whitespace, a tag or a quote
+URL_PATTERN = re.compile(r"(https?://[^\s<\"]+)")
+LINK_TEMPLATE = r'<a href="\1" style="color:#2E86C1;text-decoration:none;">\1</a>'
+
+# Notes longer than this are shown a chunk at a time
+CHUNK_CHARS = 32 * 1024
+
+
+class PreviewRenderer(QObject):
+    """
+    Renders note content as linkified HTML into a QTextBrowser.
+
+    Rendered chunks are cached by note id and content hash, so revisiting a note
+    skips the conversion. Large notes are split at line breaks: the first chunk
+    is rendered and shown immediately and the rest are rendered and appended
+    from the event loop, one chunk per iteration, so the UI stays responsive
+    while they load.
+    """
+
+    def __init__(self, browser, cache_chars=32 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.cache_chars = cache_chars
+        self._cache = OrderedDict()  # (note_id, digest) -> [(html chunk, new_block)]
+        self._cached_chars = 0
+        self._generation = 0  # bumped whenever the preview changes; stale chunks are dropped
+        self._streaming = False
+
+    @staticmethod
+    def _split(content):
+        """
+        Split text into chunks of about CHUNK_CHARS as (text, new_block) pairs.
+        Chunks break at newlines; a longer line is cut at a space (or, failing
+        that, anywhere) and continues the same block instead of starting one.
+        """
+        chunks = []
+        start = 0
+        new_block = True
+        while len(content) - start > CHUNK_CHARS:
+            limit = start + CHUNK_CHARS
+            cut = content.rfind("\n", start, limit)
+            if cut > start:
+                chunks.append((content[start:cut], new_block))
+                start, new_block = cut + 1, True  # the newline becomes the block break
+                continue
+            # No newline in reach: cut the line after a space, keeping URLs whole
+            cut = content.rfind(" ", start, limit)
+            cut = cut + 1 if cut > start else limit
+            if 0xD800 <= ord(content[cut - 1]) <= 0xDBFF:
+                cut -= 1  # don't separate a surrogate pair
+            chunks.append((content[start:cut], new_block))
+            start, new_block = cut, False
+        chunks.append((content[start:], new_block))
+        return chunks
+
+    @staticmethod
+    def render_html(text):
+        """Escape text, make URLs clickable and keep line breaks."""
+        escaped = html.escape(text, quote=False)
+        return URL_PATTERN.sub(LINK_TEMPLATE, escaped).replace("\n", "<br>")
+
+    @staticmethod
+    def _cache_key(note_id, content):
+        digest = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return note_id, digest
+
+    def _store(self, key, chunks):
+        size = sum(len(chunk) for chunk, _ in chunks)
+        if size > self.cache_chars:
+            return
+        self._cache[key] = chunks
+        self._cached_chars += size
+        while self._cached_chars > self.cache_chars:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_chars -= sum(len(chunk) for chunk, _ in evicted)
+
+    def show(self, note_id, content):
+        """
+        Render a note, streaming any chunks after the first. On a cache miss only
+        the first chunk is rendered here; each later one is rendered as it is
+        appended, and the list is cached once the note has been shown in full.
+        """
+        self._generation += 1
+        self._streaming = False
+        content = content or ""
+        key = self._cache_key(note_id, content)
+        chunks = self._cache.get(key)
+        pending = None
+        if chunks is not None:
+            self._cache.move_to_end(key)
+        else:
+            pending = self._split(content)
+            chunks = [(self.render_html(pending[0][0]), True)]
+        self.browser.setHtml(chunks[0][0])
+        if len(pending if pending is not None else chunks) > 1:
+            self._schedule(self._generation, key, chunks, pending, 1)
+        elif pending is not None:
+            self._store(key, chunks)
+
+    def _schedule(self, generation, key, chunks, pending, position):
+        self._streaming = True
+        QTimer.singleShot(0, lambda: self._append_chunk(generation, key, chunks, pending, position))
+
+    def _append_chunk(self, generation, key, chunks, pending, position):
+        if generation != self._generation:
+            return  # abandoned; a partly rendered note isn't cached
+        if pending is not None:
+            text, new_block = pending[position]
+            chunks.append((self.render_html(text), new_block))
+        chunk, new_block = chunks[position]
+        cursor = QTextCursor(self.browser.document())
+        cursor.movePosition(QTextCursor.End)
+        if new_block:
+            cursor.insertBlock()
+        cursor.insertHtml(chunk)
+        if position + 1 < len(pending if pending is not None else chunks):
+            self._schedule(generation, key, chunks, pending, position + 1)
+        else:
+            self._streaming = False
+            if pending is not None:
+                self._store(key, chunks)
+
+    def is_streaming(self):
+        """True while chunks of the current note are still being appended."""
+        return self._streaming
+
+    def clear(self):
+        """Empty the preview and stop any chunks still being appended."""
+        self._generation += 1
+        self._streaming = False
+        self.browser.clear()
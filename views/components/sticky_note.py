@@ -1,15 +1,29 @@
+import hashlib
+
 from PySide6.QtWidgets import QMainWindow, QTextEdit, QPushButton, QVBoxLayout, QWidget
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
 
 class StickyNoteWindow(QMainWindow):
-    def __init__(self, model, note_id):
+    closed = Signal(str)  # note id
+
+    def __init__(self, model, note_id, async_model=None, geometry=None):
         super().__init__()
         self.setWindowTitle("Sticky Note")
         self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
         self.resize(350, 350)
 
         self.model = model
+        self.async_model = async_model  # when set, loads/saves run off the GUI thread
         self.note_id = note_id
+        self._loaded = False  # never save before the stored content has arrived
+        self._saved_digest = None  # hash of the content last loaded or saved
+        self._saved_geometry = bytes(geometry) if geometry else None
+        self._deleted = False
 
         # Central widget with vertical layout
         central_widget = QWidget()
@@ -45,6 +59,9 @@ class StickyNoteWindow(QMainWindow):
         self.delete_btn.clicked.connect(self.delete_note)
         layout.addWidget(self.delete_btn)
 
+        if self._saved_geometry:
+            self.restoreGeometry(self._saved_geometry)
+
         # Load content
         self.load_content()
 
@@ -54,22 +71,56 @@ class StickyNoteWindow(QMainWindow):
         self.save_timer.timeout.connect(self.save_content)
         self.text_edit.textChanged.connect(self.on_text_changed)
 
+    def _call_model(self, method, *args, callback=None):
+        if self.async_model is not None:
+            self.async_model.submit(method, *args, callback=callback)
+        else:
+            result = getattr(self.model, method)(*args)
+            if callback is not None:
+                callback(result)
+
     def load_content(self):
-        content = self.model.get_note_content(self.note_id)
+        self._call_model("get_note_content", self.note_id, callback=self._set_content)
+
+    def _set_content(self, content):
+        self._loaded = True
+        self._saved_digest = _digest(content or "")
         if content is not None:
+            # Loading is not an edit: don't let it trigger an autosave
+            self.text_edit.blockSignals(True)
             self.text_edit.setPlainText(content)
+            self.text_edit.blockSignals(False)
 
     def save_content(self):
+        if not self._loaded or self._deleted:
+            return
         content = self.text_edit.toPlainText()
-        self.model.save_note_content(self.note_id, content)
+        digest = _digest(content)
+        if digest == self._saved_digest:
+            return  # unchanged since the last load/save
+        self._saved_digest = digest
+        self._call_model("save_note_content", self.note_id, content)
+
+    def save_geometry(self):
+        if self._deleted:
+            return
+        geometry = bytes(self.saveGeometry())
+        if geometry != self._saved_geometry:
+            self._saved_geometry = geometry
+            self._call_model("save_sticky_geometry", self.note_id, geometry)
 
     def on_text_changed(self):
         self.save_timer.start(1000)
 
     def delete_note(self):
-        self.model.delete_sticky_note(self.note_id)
+        self._deleted = True
+        self.save_timer.stop()
+        self._call_model("delete_sticky_note", self.note_id)
         self.close()
 
     def closeEvent(self, event):
+        self.save_timer.stop()
         self.save_content()
+        self.save_geometry()
         super().closeEvent(event)
+        self.closed.emit(self.note_id)
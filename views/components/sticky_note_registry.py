@@ -0,0 +1,80 @@
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer
+
+from views.components.sticky_note import StickyNoteWindow
+
+# Windows created per event loop turn while restoring; the rest wait their turn
+RESTORE_BATCH = 4
+
+
+class StickyNoteRegistry(QObject):
+    """
+    Owns the open sticky note windows, one per note id.
+
+    Opening a note that already has a window raises that window instead of
+    creating a second one. restore() opens many notes a few per event loop
+    turn, so restoring dozens of them never blocks input for long.
+    """
+
+    def __init__(self, model, async_model=None, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.async_model = async_model
+        self._windows = {}
+        self._restore_queue = deque()
+        self._restore_timer = QTimer(self)
+        self._restore_timer.setInterval(0)
+        self._restore_timer.timeout.connect(self._restore_next)
+
+    def __len__(self):
+        return len(self._windows)
+
+    def __contains__(self, note_id):
+        return note_id in self._windows
+
+    def window(self, note_id):
+        return self._windows.get(note_id)
+
+    def open(self, note_id, geometry=None):
+        """Show the note's window, creating it if it isn't open yet."""
+        window = self._windows.get(note_id)
+        if window is None:
+            window = StickyNoteWindow(self.model, note_id, self.async_model, geometry=geometry)
+            window.closed.connect(self._forget)
+            self._windows[note_id] = window
+            window.show()
+        else:
+            window.showNormal()
+            window.raise_()
+            window.activateWindow()
+        return window
+
+    def restore(self, notes):
+        """Open every note ({'id', 'geometry'}) that isn't open yet, a batch at a time."""
+        queued = {note['id'] for note in self._restore_queue}
+        for note in notes:
+            if note['id'] not in self._windows and note['id'] not in queued:
+                self._restore_queue.append(note)
+        if self._restore_queue:
+            self._restore_timer.start()
+
+    def _restore_next(self):
+        for _ in range(min(RESTORE_BATCH, len(self._restore_queue))):
+            note = self._restore_queue.popleft()
+            if note['id'] not in self._windows:
+                self.open(note['id'], note.get('geometry'))
+        if not self._restore_queue:
+            self._restore_timer.stop()
+
+    def _forget(self, note_id):
+        window = self._windows.pop(note_id, None)
+        if window is not None:
+            window.deleteLater()
+
+    def close_all(self):
+        """Close (and so save) every open window."""
+        self._restore_queue.clear()
+        self._restore_timer.stop()
+        for window in list(self._windows.values()):
+            window.close()
@@ -1,104 +1,24 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSizePolicy
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QIcon
-from matplotlib import rcParams
 
-from views.components.pong import PongGame
-from views.components.sticky_note import StickyNoteWindow
 from utils.resource_path_utils import resource_path
+from utils.startup_profiler import profiler
 from helpers.style_sidebar_button import style_toolbar_button
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-
-import numpy as np
-
-class AnimatedGraph(FigureCanvas):
-    """Responsive, smooth, transparent line graph for the dashboard."""
-
-    def __init__(self, parent=None, update_interval=30):
-        self.fig = Figure(figsize=(6, 3), dpi=100)
-        self.fig.patch.set_alpha(0.0)  # Transparent
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setStyleSheet("background-color:transparent;")
-
-        self.axes = self.fig.add_subplot(111)
-        self.axes.patch.set_alpha(0.0)
-
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        # Stats
-        self.categories = ["Contacts", "Bookmarks", "CoPilot", "Notes"]
-        self.current_values = np.array([0, 0, 0, 0], dtype=float)
-        self.target_values = np.array([0, 0, 0, 0], dtype=float)
-
-        # Animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._animate_step)
-        self.timer.start(update_interval)  # milliseconds
-
-        self.plot_graph()
-
-    def plot_graph(self):
-        self.axes.clear()
-
-        self.fig.patch.set_facecolor('none')
-        self.fig.patch.set_alpha(0.0)
-        self.axes.patch.set_facecolor('none')
-
-        # Line with markers
-        self.axes.plot(self.categories, self.current_values, marker='o',
-                       color="#2E86C1", linewidth=2, markersize=6)
-        self.axes.fill_between(self.categories, self.current_values, [0] * len(self.categories),
-                               color="#2E86C1", alpha=0.1)
-
-        # Remove spines and ticks
-        for spine in self.axes.spines.values():
-            spine.set_visible(False)
-        self.axes.set_xticks(self.categories)
-        self.axes.set_yticks([])
-        self.axes.grid(False)
-
-        # Labels above points
-        max_val = max(max(self.current_values), 10)
-        for x, y in zip(self.categories, self.current_values):
-            self.axes.text(x, y + max_val * 0.03, f"{y:.0f}", ha='center', va='bottom',
-                           fontsize=10, clip_on=False)
-
-        # Set Y limits with padding at bottom
-        bottom_padding = max(0.05 * max_val, 1)
-        self.axes.set_ylim(-bottom_padding, max_val + max_val * 0.15)
-
-        self.fig.set_constrained_layout(True)
-        self.draw()
-
-    def _animate_step(self):
-        """Smoothly move current_values towards target_values."""
-        diff = self.target_values - self.current_values
-        step = diff * 0.1  # smoothing factor
-        self.current_values += step
-        if np.all(np.abs(diff) < 0.01):
-            self.current_values = self.target_values.copy()  # snap to target
-        self.plot_graph()
-
-    def update_stats(self, contacts=None, bookmarks=None, copilot=None, notes=None):
-        """Set new target values for smooth transition."""
-        if contacts is not None:
-            self.target_values[0] = contacts
-        if bookmarks is not None:
-            self.target_values[1] = bookmarks
-        if copilot is not None:
-            self.target_values[2] = copilot
-        if notes is not None:
-            self.target_values[3] = notes
+
+# matplotlib/numpy (AnimatedGraph), PongGame and StickyNoteWindow are imported on
+# first use so they stay off the startup path.
+
+# Delay before building the graph, so the window's first frame is painted first
+GRAPH_BUILD_DELAY_MS = 50
+
 
 class DashboardView(QWidget):
-    def __init__(self, model):
+    def __init__(self, model, async_model=None):
         super().__init__()
 
         self.model = model  # Store model reference
+        self.async_model = async_model  # Optional worker-thread facade over the model
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -113,9 +33,15 @@ class DashboardView(QWidget):
         title_img.setStyleSheet("margin: 0; padding: 0;")
         layout.addWidget(title_img, alignment=Qt.AlignCenter)
 
-        # Graph stats
-        self.graph = AnimatedGraph()
-        layout.addWidget(self.graph)
+        # Graph stats: a placeholder until the graph is built after the first paint
+        self.graph = None
+        self._graph_values = {}
+        self._graph_slot = QWidget()
+        self._graph_slot.setMinimumHeight(300)
+        self._graph_slot.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._graph_layout = QVBoxLayout(self._graph_slot)
+        self._graph_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._graph_slot)
 
         # Stat panels layout
         stats_layout = QHBoxLayout()
@@ -171,8 +97,8 @@ class DashboardView(QWidget):
 
         layout.addLayout(buttons_layout)
 
-        # Keep track of sticky notes windows
-        self._sticky_notes = []
+        # Open sticky note windows, keyed by note id (created on first use)
+        self._sticky_notes = None
 
     def _create_stat_widget(self, label_text, value_text):
         widget = QWidget()
@@ -206,34 +132,70 @@ class DashboardView(QWidget):
         if copilot_count is not None:
             self.copilot_stat.value_label.setText(str(copilot_count))
 
-        # Update dynamic graph
-        self.graph.update_stats(
+        # Update dynamic graph (applied when it is built if it doesn't exist yet)
+        self._graph_values = dict(
             contacts=int(self.contacts_stat.value_label.text()),
             bookmarks=int(self.bookmarks_stat.value_label.text()),
             copilot=int(self.copilot_stat.value_label.text()),
             notes=int(self.notes_stat.value_label.text())
         )
+        if self.graph is not None:
+            self.graph.update_stats(**self._graph_values)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.graph is None:
+            # Build after this paint so the window appears before matplotlib loads
+            QTimer.singleShot(GRAPH_BUILD_DELAY_MS, self._build_graph)
+
+    def _build_graph(self):
+        if self.graph is not None:
+            return
+        with profiler.span("dashboard graph (matplotlib import + AnimatedGraph)"):
+            from views.components.animated_graph import AnimatedGraph
+            self.graph = AnimatedGraph()
+        self._graph_layout.addWidget(self.graph)
+        if self._graph_values:
+            self.graph.update_stats(**self._graph_values)
 
     def launch_pong_game(self):
+        from views.components.pong import PongGame
         self.pong_window = PongGame()
         self.pong_window.show()
 
+    def _call_model(self, method, *args, callback):
+        """Run a model call on the worker thread when available, otherwise inline."""
+        if self.async_model is not None:
+            self.async_model.submit(method, *args, callback=callback)
+        else:
+            callback(getattr(self.model, method)(*args))
+
+    @property
+    def sticky_notes(self):
+        if self._sticky_notes is None:
+            from views.components.sticky_note_registry import StickyNoteRegistry
+            self._sticky_notes = StickyNoteRegistry(self.model, self.async_model, parent=self)
+        return self._sticky_notes
+
+    def close_sticky_notes(self):
+        """Close every open sticky note, which saves its content and geometry."""
+        if self._sticky_notes is not None:
+            self._sticky_notes.close_all()
+
+    def _open_sticky_note(self, note_id):
+        self.sticky_notes.open(note_id)
+
     def launch_new_sticky_note(self):
-        note_id = self.model.add_sticky_note()
-        sticky = StickyNoteWindow(self.model, note_id)
-        sticky.show()
-        self._sticky_notes.append(sticky)
+        self._call_model("add_sticky_note", callback=self._open_sticky_note)
 
     def load_sticky_notes(self):
+        self._call_model("get_sticky_notes", callback=self._show_sticky_notes)
+
+    def _show_sticky_notes(self, notes):
         from PySide6.QtWidgets import QMessageBox
-        notes = self.model.get_notes("sticky")
         if not notes:
             QMessageBox.information(self, "Sticky Notes", "No sticky notes found.")
             return
 
-        for note in notes:
-            sticky = StickyNoteWindow(self.model, note["id"])
-            sticky.show()
-            self._sticky_notes.append(sticky)
-
-
+        # Already open windows are kept as they are; the rest open a few at a time
+        self.sticky_notes.restore(notes)
@@ -1,17 +1,19 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeWidget, QTreeWidgetItem,
-    QLabel, QAbstractItemView, QSizePolicy, QTextBrowser
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListView,
+    QLabel, QAbstractItemView, QSizePolicy, QTextBrowser, QLineEdit
 )
 from PySide6.QtCore import Qt, QTimer, QUrl
 from PySide6.QtGui import QIcon, QDesktopServices
 
 from utils.resource_path_utils import resource_path
-from views.dashboard import DashboardView
 from views.components.sidebar import Sidebar
 from models.model import NoteModel
+from models.async_model import AsyncNoteModel
 from helpers.editor_helper import open_note_editor
+from controllers.navigation import Navigation
 from views.components.dashboard_container import DashboardContainer
-import re
+from views.components.note_list_model import NoteListModel
+from views.components.preview_renderer import PreviewRenderer
 
 
 class MainView(QWidget):
@@ -20,12 +22,13 @@ class MainView(QWidget):
     Provides sidebar, note list, preview, and top toolbar buttons.
     """
 
-    def __init__(self):
+    def __init__(self, model=None, async_model=None):
         super().__init__()
 
         # === Core model/state ===
-        self.note_model = NoteModel()
-        self.current_category = None
+        self.note_model = model if model is not None else NoteModel()
+        # Database I/O for the view runs on the async model's worker thread
+        self.async_model = async_model if async_model is not None else AsyncNoteModel(self.note_model, parent=self)
         self.current_note_id = None
         self.current_note_content = ""
         self._editor_open = False  # guard flag
@@ -79,17 +82,39 @@ class MainView(QWidget):
         bottom_layout.setSpacing(5)
 
         # Dashboard Container
-        self.dashboard_container = DashboardContainer(model=self.note_model)
+        self.dashboard_container = DashboardContainer(model=self.note_model, async_model=self.async_model)
         right_layout.addWidget(self.dashboard_container, alignment=Qt.AlignTop)
         right_layout.addWidget(bottom_container, stretch=1)
 
-        # Note list
-        self.note_list = QTreeWidget()
-        self.note_list.setColumnCount(1)
-        self.note_list.setHeaderLabels([""])
+        # Search box + note list
+        list_container = QWidget()
+        list_layout = QVBoxLayout(list_container)
+        list_layout.setContentsMargins(0, 0, 0, 0)
+        list_layout.setSpacing(4)
+
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search notes...")
+        self.search_box.setClearButtonEnabled(True)
+        list_layout.addWidget(self.search_box)
+
+        # Debounce search-as-you-type so a burst of keystrokes runs one query
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(lambda: self.navigation.search(self.search_box.text()))
+
+        # Paged, database-backed list model; only loaded rows live in memory
+        self.note_list_model = NoteListModel(self.async_model, parent=self)
+        self.note_list = QListView()
+        self.note_list.setModel(self.note_list_model)
+        self.note_list.setUniformItemSizes(True)
         self.note_list.setSelectionMode(QAbstractItemView.SingleSelection)
         self.note_list.setMinimumWidth(200)
-        bottom_layout.addWidget(self.note_list, stretch=1)
+        list_layout.addWidget(self.note_list, stretch=1)
+
+        # Current category and selection; the one place navigation loads from the model
+        self.navigation = Navigation(self.async_model, self.note_list_model, parent=self)
+        bottom_layout.addWidget(list_container, stretch=1)
 
         # Preview pane
         self.preview = QTextBrowser()
@@ -98,101 +123,83 @@ class MainView(QWidget):
         self.preview.anchorClicked.connect(self.open_link_externally)
         self.preview.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         bottom_layout.addWidget(self.preview, stretch=2)
+        self.preview_renderer = PreviewRenderer(self.preview, parent=self)
 
         # === Connections ===
-        self.sidebar.category_selected.connect(self.load_notes_for_category)
-        self.note_list.itemSelectionChanged.connect(self.on_note_selected)
-        self.note_list.itemDoubleClicked.connect(self.handle_double_click)
-        self.add_btn.clicked.connect(self.add_new_note)
-        self.edit_btn.clicked.connect(self.handle_edit_click)
-        self.delete_btn.clicked.connect(self.delete_selected_note)
+        # Add/Edit/Delete are wired by NoteController
+        self.sidebar.category_selected.connect(self.navigation.select_category)
+        self.sidebar.dashboard_btn.clicked.connect(self.navigation.show_dashboard)
+        self.search_box.textChanged.connect(lambda _: self._search_timer.start())
+        self.note_list.selectionModel().selectionChanged.connect(
+            lambda *_: self.navigation.select_note(self.selected_note_id()))
+        self.note_list.doubleClicked.connect(self.handle_double_click)
+
+        self.navigation.category_changed.connect(self.load_notes_for_category)
+        self.navigation.dashboard_opened.connect(self.show_dashboard)
+        self.navigation.note_loaded.connect(self._show_note)
+
+    @property
+    def current_category(self):
+        return self.navigation.category
 
     # ---------------- Internal Helpers ----------------
-    def populate_note_list(self, notes):
-        self.note_list.blockSignals(True)
-        self.note_list.clear()
-        for note in notes:
-            item = QTreeWidgetItem([note["title"]])
-            item.setData(0, Qt.ItemDataRole.UserRole, note["id"])
-            self.note_list.addTopLevelItem(item)
-        self.note_list.blockSignals(False)
-
-    def on_note_selected(self):
-        """Updates the preview when a note is selected and makes URLs clickable."""
-        selected_items = self.note_list.selectedItems()
-        if not selected_items or not self.current_category:
-            self.preview.clear()
-            return
-
-        item = selected_items[0]
-        note_id = item.data(0, Qt.ItemDataRole.UserRole)
-        note = self.note_model.get_note_by_id(self.current_category, note_id)
+    def selected_note_id(self):
+        """Return the id of the selected note, or None."""
+        indexes = self.note_list.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return indexes[0].data(NoteListModel.IdRole)
+
+    def _show_note(self, note_id, note):
         if not note:
-            self.preview.clear()
+            self.current_note_id = None
+            self.current_note_content = ""
+            self.preview_renderer.clear()
             return
 
         self.current_note_id = note_id
         self.current_note_content = note["content"]
-
-        # Convert URLs to clickable links
-        def linkify(text):
-            url_pattern = r"(https?://[^\s]+)"
-            return re.sub(
-                url_pattern,
-                r'<a href="\1" style="color:#2E86C1;text-decoration:none;">\1</a>',
-                text
-            )
-
-        html_content = linkify(self.current_note_content).replace("\n", "<br>")
-        self.preview.setHtml(html_content)
+        # Linkified HTML is cached per note; large notes are streamed in chunks
+        self.preview_renderer.show(note_id, self.current_note_content)
 
     def open_link_externally(self, url: QUrl):
         """Open clicked URL in default system browser."""
         QDesktopServices.openUrl(url)
 
     # ---------------- Event Handlers ----------------
-    def handle_double_click(self, item, column):
-        if not item or not self.current_category:
-            return
-        QTimer.singleShot(0, lambda: open_note_editor(self, item, self.current_category))
-
-    def handle_edit_click(self):
-        selected_items = self.note_list.selectedItems()
-        if not selected_items or not self.current_category:
+    def handle_double_click(self, index):
+        note_id = index.data(NoteListModel.IdRole) if index.isValid() else None
+        if not note_id or not self.current_category:
             return
-        item = selected_items[0]
-
-        def _open():
-            if getattr(self, "_editor_open", False):
-                return
-            self._editor_open = True
-            try:
-                open_note_editor(self, item, self.current_category)
-            finally:
-                QTimer.singleShot(0, lambda: setattr(self, "_editor_open", False))
-
-        QTimer.singleShot(0, _open)
+        QTimer.singleShot(0, lambda: open_note_editor(self, note_id, self.current_category))
 
     # ---------------- Public Methods ----------------
     def set_category_title(self, title: str):
         self.category_title.setText(title)
 
     def load_notes_for_category(self, category):
-        self.current_category = category
+        """Reset the notes view for a category Navigation has just opened."""
         self.set_category_title(category)
-        notes = self.note_model.get_notes(category)
-        self.populate_note_list(notes)
+        self._search_timer.stop()
+        self.search_box.blockSignals(True)
+        self.search_box.clear()
+        self.search_box.blockSignals(False)
         self.current_note_id = None
         self.current_note_content = ""
-        self.preview.clear()
+        self.preview_renderer.clear()
         self.show_notes()
 
     def show_dashboard(self):
         """Switches to dashboard view."""
+        self.set_category_title("Dashboard")
+        self.current_note_id = None
+        self.current_note_content = ""
+        self.preview_renderer.clear()
         self.category_title.hide()
         self.add_btn.hide()
         self.edit_btn.hide()
         self.delete_btn.hide()
+        self.search_box.hide()
         self.note_list.hide()
         self.preview.hide()
         self.dashboard_container.show_dashboard()
@@ -204,21 +211,7 @@ class MainView(QWidget):
         self.add_btn.show()
         self.edit_btn.show()
         self.delete_btn.show()
+        self.search_box.show()
         self.note_list.show()
         self.preview.show()
         self.dashboard_container.hide_dashboard()
-
-    def add_new_note(self):
-        if not self.current_category:
-            return
-        self.note_model.add_note(self.current_category, "", "")
-        self.load_notes_for_category(self.current_category)
-
-    def delete_selected_note(self):
-        selected_items = self.note_list.selectedItems()
-        if not selected_items or not self.current_category:
-            return
-        item = selected_items[0]
-        note_id = item.data(0, Qt.ItemDataRole.UserRole)
-        self.note_model.delete_note(self.current_category, note_id)
-        self.load_notes_for_category(self.current_category)